@@ -1,6 +1,6 @@
 use no_nulls::{rolling_apply_agg_window, RollingAggWindowNoNulls};
 
-use super::sum::SumWindow;
+use super::sum::{RunningSum, SumWindow};
 use super::*;
 
 pub struct MeanWindow<'a, T> {
@@ -24,6 +24,42 @@ impl<
     }
 }
 
+/// Rolling mean over windows that are not centered.
+///
+/// Updates a single running sum with the entering and the leaving value of
+/// every step and writes the mean directly. The sum is kept in `f64`, so that
+/// `f32` data keeps its own (narrower) kernel without losing precision in the
+/// long running accumulation.
+fn rolling_mean_fixed<T>(values: &[T], window_size: usize, min_periods: usize) -> ArrayRef
+where
+    T: NativeType + Float,
+{
+    let len = values.len();
+    let mut sum = RunningSum::<f64>::new();
+    let window_len = window_size as f64;
+    let to_f64 = |v: &T| v.to_f64().unwrap();
+    let from_f64 = |v: f64| -> T { NumCast::from(v).unwrap() };
+
+    let mut out = Vec::with_capacity(len);
+    // windows at the start that are not yet full
+    for (i, v) in values.iter().take(window_size).enumerate() {
+        sum.push(to_f64(v));
+        out.push(from_f64(sum.sum() / (i + 1) as f64));
+    }
+    for (entering, leaving) in values.iter().skip(window_size).zip(values) {
+        sum.push(to_f64(entering));
+        sum.pop(to_f64(leaving));
+        out.push(from_f64(sum.sum() / window_len));
+    }
+
+    let validity = create_validity(min_periods, len, window_size, det_offsets);
+    Box::new(PrimitiveArray::new(
+        T::PRIMITIVE.into(),
+        out.into(),
+        validity.map(|b| b.into()),
+    ))
+}
+
 pub fn rolling_mean<T>(
     values: &[T],
     window_size: usize,
@@ -41,12 +77,7 @@ where
             min_periods,
             det_offsets_center,
         ),
-        (false, None) => rolling_apply_agg_window::<MeanWindow<_>, _, _>(
-            values,
-            window_size,
-            min_periods,
-            det_offsets,
-        ),
+        (false, None) => rolling_mean_fixed(values, window_size, min_periods),
         (true, Some(weights)) => {
             let weights = no_nulls::coerce_weights(weights);
             no_nulls::rolling_apply_weights(
@@ -71,3 +102,48 @@ where
         }
     }
 }
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn test_rolling_mean() {
+        let values = &[1.0f64, 2.0, 3.0, 4.0];
+        let out = rolling_mean(values, 2, 1, false, None);
+        let out = out.as_any().downcast_ref::<PrimitiveArray<f64>>().unwrap();
+        let out = out.into_iter().map(|v| v.copied()).collect::<Vec<_>>();
+        assert_eq!(out, &[Some(1.0), Some(1.5), Some(2.5), Some(3.5)]);
+
+        // non-finite values leave the window again
+        let values = &[1.0, f64::nan(), 3.0, f64::INFINITY, 5.0, 6.0, 7.0];
+        let out = rolling_mean(values, 2, 2, false, None);
+        let out = out.as_any().downcast_ref::<PrimitiveArray<f64>>().unwrap();
+        let out = out.into_iter().map(|v| v.copied()).collect::<Vec<_>>();
+        assert_eq!(
+            format!("{:?}", out.as_slice()),
+            format!(
+                "{:?}",
+                &[
+                    None,
+                    Some(f64::nan()),
+                    Some(f64::nan()),
+                    Some(f64::INFINITY),
+                    Some(f64::INFINITY),
+                    Some(5.5),
+                    Some(6.5)
+                ]
+            )
+        );
+    }
+
+    #[test]
+    fn test_rolling_mean_f32_no_drift() {
+        let values = (0..1_000_000)
+            .map(|i| if i % 2 == 0 { 1000.1f32 } else { 0.1 })
+            .collect::<Vec<_>>();
+        let out = rolling_mean(&values, 2, 2, false, None);
+        let out = out.as_any().downcast_ref::<PrimitiveArray<f32>>().unwrap();
+        assert!((out.value(values.len() - 1) - 500.1).abs() < 1e-3);
+    }
+}
@@ -1,3 +1,5 @@
+use std::collections::VecDeque;
+
 use no_nulls;
 use no_nulls::{rolling_apply_agg_window, RollingAggWindowNoNulls};
 
@@ -18,253 +20,88 @@ impl<'a, T: NativeType> RollingAggWindowNoNulls<'a, T> for SortedMinMax<'a, T> {
     }
 }
 
-pub struct MinWindow<'a, T: NativeType + PartialOrd + IsFloat> {
+/// Rolling minimum (`MAX == false`) or maximum (`MAX == true`).
+///
+/// Keeps a deque with the indices of the values that can still become the
+/// extremum of a future window. Their values are monotonic, so the extremum of the
+/// current window is always at the front, and every index is pushed and popped at
+/// most once, making an update amortized O(1) regardless of the window size.
+pub struct ExtremumWindow<'a, T: NativeType, const MAX: bool> {
     slice: &'a [T],
-    min: T,
+    candidates: VecDeque<usize>,
     last_start: usize,
     last_end: usize,
 }
 
-impl<'a, T: NativeType + IsFloat + PartialOrd> RollingAggWindowNoNulls<'a, T> for MinWindow<'a, T> {
-    fn new(slice: &'a [T], start: usize, end: usize) -> Self {
-        let min = *slice[start..end]
-            .iter()
-            .min_by(|a, b| compare_fn_nan_min(*a, *b))
-            .unwrap_or(&slice[start]);
-        Self {
-            slice,
-            min,
-            last_start: start,
-            last_end: end,
-        }
-    }
-
-    unsafe fn update(&mut self, start: usize, end: usize) -> T {
-        // recompute min
-        if start >= self.last_end
-            // the window only got smaller
-            || end == self.last_end
-        {
-            self.min = *self
-                .slice
-                .get_unchecked(start..end)
-                .iter()
-                .min_by(|a, b| compare_fn_nan_min(*a, *b))
-                .unwrap_or(self.slice.get_unchecked(start));
+pub type MinWindow<'a, T> = ExtremumWindow<'a, T, false>;
+pub type MaxWindow<'a, T> = ExtremumWindow<'a, T, true>;
 
-            self.last_start = start;
-            self.last_end = end;
-
-            return self.min;
+impl<'a, T: NativeType + IsFloat + PartialOrd, const MAX: bool> ExtremumWindow<'a, T, MAX> {
+    /// Whether `earlier` can never be the extremum anymore once `later` has entered the window.
+    #[inline]
+    fn is_dominated(earlier: &T, later: &T) -> bool {
+        if MAX {
+            compare_fn_nan_max(earlier, later) != Ordering::Greater
+        } else {
+            compare_fn_nan_min(earlier, later) != Ordering::Less
         }
+    }
 
-        let mut recompute_min = false;
-        // remove elements that should leave the window
-        for idx in self.last_start..start {
-            // safety
-            // we are in bounds
-            let leaving_value = self.slice.get_unchecked(idx);
-
-            // if the leaving value is the
-            // max value, we need to recompute the max.
-            if matches!(
-                compare_fn_nan_min(leaving_value, &self.min),
-                Ordering::Equal
-            ) {
-                recompute_min = true;
+    /// # Safety
+    /// `idx` must be within the bounds of `self.slice`
+    #[inline]
+    unsafe fn push(&mut self, idx: usize) {
+        let value = self.slice.get_unchecked(idx);
+        while let Some(&back) = self.candidates.back() {
+            if Self::is_dominated(self.slice.get_unchecked(back), value) {
+                self.candidates.pop_back();
+            } else {
                 break;
             }
         }
-
-        let entering_min = self
-            .slice
-            .get_unchecked(self.last_end..end)
-            .iter()
-            .min_by(|a, b| compare_fn_nan_min(*a, *b))
-            .unwrap_or(self.slice.get_unchecked(std::cmp::min(
-                self.last_start,
-                self.last_end.saturating_sub(1),
-            )));
-
-        if recompute_min {
-            match compare_fn_nan_min(&self.min, entering_min) {
-                // do nothing
-                Ordering::Equal => {}
-                // leaving < entering
-                Ordering::Less => {
-                    // leaving value could be the smallest, we might need to recompute
-
-                    // check the values in between the window we did not yet
-                    // compute to find the max there. We compare that with the `entering_max`
-                    // if any value is equal to equal to `self.max` of previous window we can break
-                    // early
-                    let mut min_in_between = self.slice.get_unchecked(start);
-                    for idx in (start + 1)..self.last_end {
-                        // safety
-                        // we are in bounds
-                        let value = self.slice.get_unchecked(idx);
-
-                        if matches!(compare_fn_nan_min(value, min_in_between), Ordering::Less) {
-                            min_in_between = value;
-                        }
-
-                        // the min is also in the in between values
-                        if matches!(compare_fn_nan_min(value, &self.min), Ordering::Equal) {
-                            self.last_start = start;
-                            self.last_end = end;
-                            return self.min;
-                        }
-                    }
-
-                    if matches!(
-                        compare_fn_nan_min(min_in_between, entering_min),
-                        Ordering::Less
-                    ) {
-                        self.min = *min_in_between
-                    } else {
-                        self.min = *entering_min
-                    }
-                }
-                // leaving > entering
-                Ordering::Greater => {
-                    if matches!(compare_fn_nan_min(entering_min, &self.min), Ordering::Less) {
-                        self.min = *entering_min
-                    }
-                }
-            }
-        } else if matches!(compare_fn_nan_min(entering_min, &self.min), Ordering::Less) {
-            self.min = *entering_min
-        }
-
-        self.last_start = start;
-        self.last_end = end;
-        self.min
+        self.candidates.push_back(idx);
     }
 }
 
-pub struct MaxWindow<'a, T: NativeType> {
-    slice: &'a [T],
-    max: T,
-    last_start: usize,
-    last_end: usize,
-}
-
-impl<'a, T: NativeType + IsFloat + PartialOrd> RollingAggWindowNoNulls<'a, T> for MaxWindow<'a, T> {
+impl<'a, T: NativeType + IsFloat + PartialOrd, const MAX: bool> RollingAggWindowNoNulls<'a, T>
+    for ExtremumWindow<'a, T, MAX>
+{
     fn new(slice: &'a [T], start: usize, end: usize) -> Self {
-        let max = *slice[start..end]
-            .iter()
-            .max_by(|a, b| compare_fn_nan_max(*a, *b))
-            .unwrap_or(&slice[start]);
-        Self {
+        let mut out = Self {
             slice,
-            max,
+            candidates: VecDeque::with_capacity(end.saturating_sub(start)),
             last_start: start,
             last_end: end,
+        };
+        for idx in start..end {
+            // safety: we are in bounds
+            unsafe { out.push(idx) }
         }
+        out
     }
 
     unsafe fn update(&mut self, start: usize, end: usize) -> T {
-        // recompute max
-        if start >= self.last_end
-            // the window only got smaller
-            || end == self.last_end
-        {
-            self.max = *self
-                .slice
-                .get_unchecked(start..end)
-                .iter()
-                .max_by(|a, b| compare_fn_nan_max(*a, *b))
-                .unwrap_or(self.slice.get_unchecked(start));
-
-            self.last_start = start;
-            self.last_end = end;
-
-            return self.max;
+        // the window moved backwards, start over
+        if start < self.last_start || end < self.last_end {
+            self.candidates.clear();
+            self.last_end = start;
         }
-
-        let mut recompute_max = false;
-        for idx in self.last_start..start {
-            // safety
-            // we are in bounds
-            let leaving_value = self.slice.get_unchecked(idx);
-            // if the leaving value is the max value, we need to recompute the max.
-            if matches!(
-                compare_fn_nan_max(leaving_value, &self.max),
-                Ordering::Equal
-            ) {
-                recompute_max = true;
-                break;
-            }
+        for idx in std::cmp::max(self.last_end, start)..end {
+            self.push(idx)
         }
-
-        let entering_max = self
-            .slice
-            .get_unchecked(self.last_end..end)
-            .iter()
-            .max_by(|a, b| compare_fn_nan_max(*a, *b))
-            .unwrap_or(self.slice.get_unchecked(std::cmp::max(
-                self.last_start,
-                self.last_end.saturating_sub(1),
-            )));
-
-        if recompute_max {
-            match compare_fn_nan_max(&self.max, entering_max) {
-                // do nothing
-                Ordering::Equal => {}
-                // leaving < entering
-                Ordering::Less => {
-                    if matches!(
-                        compare_fn_nan_max(entering_max, &self.max),
-                        Ordering::Greater
-                    ) {
-                        self.max = *entering_max
-                    }
-                }
-                // leaving > entering
-                Ordering::Greater => {
-                    // leaving value could be the largest, we might need to recompute
-
-                    // check the values in between the window we did not yet
-                    // compute to find the max there. We compare that with the `entering_max`
-                    // if any value is equal to equal to `self.max` of previous window we can break
-                    // early
-                    let mut max_in_between = self.slice.get_unchecked(start);
-                    for idx in (start + 1)..self.last_end {
-                        // safety
-                        // we are in bounds
-                        let value = self.slice.get_unchecked(idx);
-
-                        if matches!(compare_fn_nan_max(value, max_in_between), Ordering::Greater) {
-                            max_in_between = value;
-                        }
-
-                        // the max is also in the in between values
-                        if matches!(compare_fn_nan_max(value, &self.max), Ordering::Equal) {
-                            self.last_start = start;
-                            self.last_end = end;
-                            return self.max;
-                        }
-                    }
-
-                    if matches!(
-                        compare_fn_nan_max(max_in_between, entering_max),
-                        Ordering::Greater
-                    ) {
-                        self.max = *max_in_between
-                    } else {
-                        self.max = *entering_max
-                    }
-                }
+        // remove elements that left the window
+        while let Some(&front) = self.candidates.front() {
+            if front < start {
+                self.candidates.pop_front();
+            } else {
+                break;
             }
-        } else if matches!(
-            compare_fn_nan_max(entering_max, &self.max),
-            Ordering::Greater
-        ) {
-            self.max = *entering_max
         }
         self.last_start = start;
         self.last_end = end;
-        self.max
+
+        let idx = self.candidates.front().copied().unwrap_or(start);
+        *self.slice.get_unchecked(idx)
     }
 }
 
@@ -297,6 +134,71 @@ where
     max
 }
 
+/// Extremum of a (small) window, in the same NaN semantics as [`ExtremumWindow`].
+#[inline]
+fn window_extremum<T: NativeType + IsFloat + PartialOrd, const MAX: bool>(window: &[T]) -> T {
+    let mut out = window[0];
+    for v in &window[1..] {
+        if ExtremumWindow::<T, MAX>::is_dominated(&out, v) {
+            out = *v
+        }
+    }
+    out
+}
+
+/// Rolling min/max over a window size that is known at compile time.
+///
+/// For small windows, computing every window directly is cheaper than
+/// maintaining a deque: the inner loop is fully unrolled and has no
+/// data dependent branches between windows.
+fn rolling_extremum_fixed<T, const W: usize, const MAX: bool>(
+    values: &[T],
+    min_periods: usize,
+) -> ArrayRef
+where
+    T: NativeType + IsFloat + PartialOrd,
+{
+    let len = values.len();
+    let mut out = Vec::with_capacity(len);
+    // windows at the start that are not yet full
+    for i in 0..std::cmp::min(W - 1, len) {
+        out.push(window_extremum::<T, MAX>(&values[..i + 1]));
+    }
+    out.extend(values.windows(W).map(|window| {
+        let window: &[T; W] = window.try_into().unwrap();
+        window_extremum::<T, MAX>(window)
+    }));
+
+    let validity = create_validity(min_periods, len, W, det_offsets);
+    Box::new(PrimitiveArray::new(
+        T::PRIMITIVE.into(),
+        out.into(),
+        validity.map(|b| b.into()),
+    ))
+}
+
+/// Dispatch to [`rolling_extremum_fixed`] if the window is small enough.
+fn rolling_extremum_small<T, const MAX: bool>(
+    values: &[T],
+    window_size: usize,
+    min_periods: usize,
+) -> Option<ArrayRef>
+where
+    T: NativeType + IsFloat + PartialOrd,
+{
+    let out = match window_size {
+        2 => rolling_extremum_fixed::<T, 2, MAX>(values, min_periods),
+        3 => rolling_extremum_fixed::<T, 3, MAX>(values, min_periods),
+        4 => rolling_extremum_fixed::<T, 4, MAX>(values, min_periods),
+        5 => rolling_extremum_fixed::<T, 5, MAX>(values, min_periods),
+        6 => rolling_extremum_fixed::<T, 6, MAX>(values, min_periods),
+        7 => rolling_extremum_fixed::<T, 7, MAX>(values, min_periods),
+        8 => rolling_extremum_fixed::<T, 8, MAX>(values, min_periods),
+        _ => return None,
+    };
+    Some(out)
+}
+
 pub fn is_reverse_sorted_max<T: NativeType + PartialOrd + IsFloat>(values: &[T]) -> bool {
     values
         .windows(2)
@@ -319,7 +221,7 @@ where
 {
     match (center, weights) {
         (true, None) => {
-            // will be O(n2) if we don't take this path we hope that we hit an early return on not sorted data
+            // sorted data is a fast path, the check returns early on unsorted data
             if is_reverse_sorted_max(values) {
                 rolling_apply_agg_window::<SortedMinMax<_>, _, _>(
                     values,
@@ -344,6 +246,10 @@ where
                     min_periods,
                     det_offsets,
                 )
+            } else if let Some(out) =
+                rolling_extremum_small::<_, true>(values, window_size, min_periods)
+            {
+                out
             } else {
                 rolling_apply_agg_window::<MaxWindow<_>, _, _>(
                     values,
@@ -414,7 +320,7 @@ where
 {
     match (center, weights) {
         (true, None) => {
-            // will be O(n2) if we don't take this path we hope that we hit an early return on not sorted data
+            // sorted data is a fast path, the check returns early on unsorted data
             if is_sorted_min(values) {
                 rolling_apply_agg_window::<SortedMinMax<_>, _, _>(
                     values,
@@ -432,7 +338,7 @@ where
             }
         }
         (false, None) => {
-            // will be O(n2)
+            // sorted data is a fast path, the check returns early on unsorted data
             if is_sorted_min(values) {
                 rolling_apply_agg_window::<SortedMinMax<_>, _, _>(
                     values,
@@ -440,6 +346,10 @@ where
                     min_periods,
                     det_offsets,
                 )
+            } else if let Some(out) =
+                rolling_extremum_small::<_, false>(values, window_size, min_periods)
+            {
+                out
             } else {
                 rolling_apply_agg_window::<MinWindow<_>, _, _>(
                     values,
@@ -560,4 +470,31 @@ mod test {
             )
         );
     }
+
+    #[test]
+    fn test_extremum_window() {
+        let values = &[4, 1, 3, 3, 8, 2, 7, 0, 5, 6, 9, 1];
+        for window_size in 1..values.len() {
+            let out = rolling_min(values, window_size, 1, false, None);
+            let out = out.as_any().downcast_ref::<PrimitiveArray<i32>>().unwrap();
+            let out_max = rolling_max(values, window_size, 1, false, None);
+            let out_max = out_max
+                .as_any()
+                .downcast_ref::<PrimitiveArray<i32>>()
+                .unwrap();
+            for i in 0..values.len() {
+                let window = &values[i.saturating_sub(window_size - 1)..i + 1];
+                assert_eq!(out.value(i), *window.iter().min().unwrap());
+                assert_eq!(out_max.value(i), *window.iter().max().unwrap());
+            }
+        }
+
+        // windows that move backwards
+        let mut window = MinWindow::<i32>::new(values, 4, 8);
+        unsafe {
+            assert_eq!(window.update(5, 9), 0);
+            assert_eq!(window.update(0, 3), 1);
+            assert_eq!(window.update(8, 12), 1);
+        }
+    }
 }
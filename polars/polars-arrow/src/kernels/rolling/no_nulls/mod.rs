@@ -126,18 +126,61 @@ where
     ((sum_of_squares / count) - mean * mean) / (count - T::one()) * count
 }
 
+/// Sum of the values of a window multiplied by their weights.
+///
+/// The products are accumulated in four independent lanes, which breaks the
+/// dependency chain between the additions so that the multiply-adds can be
+/// pipelined and vectorized.
+#[inline]
+fn weighted_sum<T>(values: &[T], weights: &[T]) -> T
+where
+    T: std::iter::Sum<T> + Copy + std::ops::Mul<Output = T> + AddAssign,
+{
+    let len = std::cmp::min(values.len(), weights.len());
+    let (values, weights) = (&values[..len], &weights[..len]);
+    if len < 8 {
+        return values.iter().zip(weights).map(|(v, w)| *v * *w).sum();
+    }
+
+    let mut acc = [
+        values[0] * weights[0],
+        values[1] * weights[1],
+        values[2] * weights[2],
+        values[3] * weights[3],
+    ];
+    let values = values[4..].chunks_exact(4);
+    let weights = weights[4..].chunks_exact(4);
+    let remainder = values
+        .remainder()
+        .iter()
+        .zip(weights.remainder())
+        .map(|(v, w)| *v * *w)
+        .sum::<T>();
+    for (v, w) in values.zip(weights) {
+        acc[0] += v[0] * w[0];
+        acc[1] += v[1] * w[1];
+        acc[2] += v[2] * w[2];
+        acc[3] += v[3] * w[3];
+    }
+    acc[0] += acc[1];
+    acc[2] += acc[3];
+    acc[0] += acc[2];
+    acc[0] += remainder;
+    acc[0]
+}
+
 pub(crate) fn compute_mean_weights<T>(values: &[T], weights: &[T]) -> T
 where
-    T: Float + std::iter::Sum<T>,
+    T: Float + std::iter::Sum<T> + AddAssign,
 {
-    values.iter().zip(weights).map(|(v, w)| *v * *w).sum::<T>() / T::from(values.len()).unwrap()
+    weighted_sum(values, weights) / T::from(values.len()).unwrap()
 }
 
 pub(crate) fn compute_sum_weights<T>(values: &[T], weights: &[T]) -> T
 where
-    T: std::iter::Sum<T> + Copy + std::ops::Mul<Output = T>,
+    T: std::iter::Sum<T> + Copy + std::ops::Mul<Output = T> + AddAssign,
 {
-    values.iter().zip(weights).map(|(v, w)| *v * *w).sum()
+    weighted_sum(values, weights)
 }
 
 pub(super) fn coerce_weights<T: NumCast>(weights: &[f64]) -> Vec<T>
@@ -67,6 +67,158 @@ impl<'a, T: NativeType + IsFloat + std::iter::Sum + AddAssign + SubAssign>
     }
 }
 
+/// Running sum of the values that enter and leave a window.
+///
+/// Finite values are accumulated with Neumaier compensation, so that adding
+/// and subtracting values for every step doesn't make the sum drift on long
+/// inputs. Non-finite values can't be subtracted again, so they are counted
+/// instead.
+pub(super) struct RunningSum<T> {
+    sum: T,
+    compensation: T,
+    n_nan: usize,
+    n_pos_inf: usize,
+    n_neg_inf: usize,
+}
+
+impl<T: Float> RunningSum<T> {
+    pub(super) fn new() -> Self {
+        Self {
+            sum: T::zero(),
+            compensation: T::zero(),
+            n_nan: 0,
+            n_pos_inf: 0,
+            n_neg_inf: 0,
+        }
+    }
+
+    #[inline]
+    fn add_finite(&mut self, v: T) {
+        let t = self.sum + v;
+        if self.sum.abs() >= v.abs() {
+            self.compensation = self.compensation + ((self.sum - t) + v);
+        } else {
+            self.compensation = self.compensation + ((v - t) + self.sum);
+        }
+        self.sum = t;
+    }
+
+    #[inline]
+    fn non_finite_count(&mut self, v: T) -> &mut usize {
+        if v.is_nan() {
+            &mut self.n_nan
+        } else if v.is_sign_positive() {
+            &mut self.n_pos_inf
+        } else {
+            &mut self.n_neg_inf
+        }
+    }
+
+    #[inline]
+    pub(super) fn push(&mut self, v: T) {
+        if v.is_finite() {
+            self.add_finite(v)
+        } else {
+            *self.non_finite_count(v) += 1
+        }
+    }
+
+    #[inline]
+    pub(super) fn pop(&mut self, v: T) {
+        if v.is_finite() {
+            self.add_finite(-v)
+        } else {
+            *self.non_finite_count(v) -= 1
+        }
+    }
+
+    #[inline]
+    pub(super) fn sum(&self) -> T {
+        if self.n_nan > 0 || (self.n_pos_inf > 0 && self.n_neg_inf > 0) {
+            T::nan()
+        } else if self.n_pos_inf > 0 {
+            T::infinity()
+        } else if self.n_neg_inf > 0 {
+            T::neg_infinity()
+        } else {
+            self.sum + self.compensation
+        }
+    }
+}
+
+/// Rolling sum of integers with windows of a fixed length that are not
+/// centered.
+///
+/// Integer addition is exact and has no NaN to recover from, so a single
+/// running sum is updated with the entering and leaving value of every step
+/// without any of the checks of [`SumWindow`]. The running sum is kept in an
+/// `i128`, because it temporarily holds only a part of the window, which can
+/// overflow `T` even if the sum of the whole window doesn't.
+fn rolling_sum_fixed_int<T>(values: &[T], window_size: usize, min_periods: usize) -> ArrayRef
+where
+    T: NativeType + NumCast,
+{
+    let len = values.len();
+    let mut sum = 0i128;
+    let to_i128 = |v: &T| v.to_i128().unwrap();
+    // every output is the sum of a window, which fits in `T`
+    let from_i128 = |v: i128| -> T { NumCast::from(v).unwrap() };
+
+    let mut out = Vec::with_capacity(len);
+    // windows at the start that are not yet full
+    for v in values.iter().take(window_size) {
+        sum += to_i128(v);
+        out.push(from_i128(sum));
+    }
+    for (entering, leaving) in values.iter().skip(window_size).zip(values) {
+        sum -= to_i128(leaving);
+        sum += to_i128(entering);
+        out.push(from_i128(sum));
+    }
+
+    let validity = create_validity(min_periods, len, window_size, det_offsets);
+    Box::new(PrimitiveArray::new(
+        T::PRIMITIVE.into(),
+        out.into(),
+        validity.map(|b| b.into()),
+    ))
+}
+
+/// Rolling sum of floats with windows of a fixed length that are not
+/// centered.
+///
+/// The sum is kept in a compensated `f64` [`RunningSum`], so that adding and
+/// subtracting every value doesn't make it drift and no window has to be
+/// summed again after a NaN left it.
+fn rolling_sum_fixed_float<T>(values: &[T], window_size: usize, min_periods: usize) -> ArrayRef
+where
+    T: NativeType + NumCast,
+{
+    let len = values.len();
+    let mut sum = RunningSum::<f64>::new();
+    let to_f64 = |v: &T| v.to_f64().unwrap();
+    let from_f64 = |v: f64| -> T { NumCast::from(v).unwrap() };
+
+    let mut out = Vec::with_capacity(len);
+    // windows at the start that are not yet full
+    for v in values.iter().take(window_size) {
+        sum.push(to_f64(v));
+        out.push(from_f64(sum.sum()));
+    }
+    for (entering, leaving) in values.iter().skip(window_size).zip(values) {
+        sum.push(to_f64(entering));
+        sum.pop(to_f64(leaving));
+        out.push(from_f64(sum.sum()));
+    }
+
+    let validity = create_validity(min_periods, len, window_size, det_offsets);
+    Box::new(PrimitiveArray::new(
+        T::PRIMITIVE.into(),
+        out.into(),
+        validity.map(|b| b.into()),
+    ))
+}
+
 pub fn rolling_sum<T>(
     values: &[T],
     window_size: usize,
@@ -84,12 +236,8 @@ where
             min_periods,
             det_offsets_center,
         ),
-        (false, None) => rolling_apply_agg_window::<SumWindow<_>, _, _>(
-            values,
-            window_size,
-            min_periods,
-            det_offsets,
-        ),
+        (false, None) if T::is_float() => rolling_sum_fixed_float(values, window_size, min_periods),
+        (false, None) => rolling_sum_fixed_int(values, window_size, min_periods),
         (true, Some(weights)) => {
             let weights = no_nulls::coerce_weights(weights);
             no_nulls::rolling_apply_weights(
@@ -169,4 +317,79 @@ mod test {
             )
         );
     }
+
+    #[test]
+    fn test_rolling_sum_no_drift() {
+        // a large value leaving the window must not take the small ones with it
+        let values = &[1e16f64, 1.0, 1.0, 1.0];
+        let out = rolling_sum(values, 2, 2, false, None);
+        let out = out.as_any().downcast_ref::<PrimitiveArray<f64>>().unwrap();
+        let out = out.into_iter().map(|v| v.copied()).collect::<Vec<_>>();
+        assert_eq!(out, &[None, Some(1e16 + 1.0), Some(2.0), Some(2.0)]);
+    }
+
+    #[test]
+    fn test_rolling_sum_int_near_bounds() {
+        let values = &[100i8, 27, 100, -128, 127];
+        let out = rolling_sum(values, 2, 2, false, None);
+        let out = out.as_any().downcast_ref::<PrimitiveArray<i8>>().unwrap();
+        let out = out.into_iter().map(|v| v.copied()).collect::<Vec<_>>();
+        assert_eq!(out, &[None, Some(127), Some(127), Some(-28), Some(-1)]);
+
+        // the sum of the window fits, but the sum of a part of it doesn't
+        let values = &[-100i8, 100, 100, -100, 100];
+        let out = rolling_sum(values, 3, 3, false, None);
+        let out = out.as_any().downcast_ref::<PrimitiveArray<i8>>().unwrap();
+        let out = out.into_iter().map(|v| v.copied()).collect::<Vec<_>>();
+        assert_eq!(out, &[None, None, Some(100), Some(100), Some(100)]);
+
+        let values = &[i64::MAX - 1, 1, i64::MAX - 1, i64::MIN, 0];
+        let out = rolling_sum(values, 2, 2, false, None);
+        let out = out.as_any().downcast_ref::<PrimitiveArray<i64>>().unwrap();
+        let out = out.into_iter().map(|v| v.copied()).collect::<Vec<_>>();
+        assert_eq!(
+            out,
+            &[
+                None,
+                Some(i64::MAX),
+                Some(i64::MAX),
+                Some(-2),
+                Some(i64::MIN)
+            ]
+        );
+    }
+
+    #[test]
+    fn test_rolling_sum_weights() {
+        let values = (0..20).map(|v| v as f64).collect::<Vec<_>>();
+        for window_size in [3, 8, 9, 13] {
+            let weights = (0..window_size).map(|v| v as f64 * 0.5).collect::<Vec<_>>();
+            let out = rolling_sum(&values, window_size, window_size, false, Some(&weights));
+            let out = out.as_any().downcast_ref::<PrimitiveArray<f64>>().unwrap();
+            for i in (window_size - 1)..values.len() {
+                let window = &values[i + 1 - window_size..i + 1];
+                let expected = window.iter().zip(&weights).map(|(v, w)| v * w).sum::<f64>();
+                assert!((out.value(i) - expected).abs() < 1e-9);
+            }
+        }
+    }
+
+    #[test]
+    fn test_rolling_sum_int() {
+        let values = &[1i64, -2, 30, 4, 5, -60, 7];
+        for window_size in 1..=values.len() {
+            for min_periods in 1..=window_size {
+                let out = rolling_sum(values, window_size, min_periods, false, None);
+                let out = out.as_any().downcast_ref::<PrimitiveArray<i64>>().unwrap();
+                let out = out.into_iter().map(|v| v.copied()).collect::<Vec<_>>();
+                let expected = (0..values.len())
+                    .map(|i| {
+                        let window = &values[(i + 1).saturating_sub(window_size)..i + 1];
+                        (window.len() >= min_periods).then(|| window.iter().sum::<i64>())
+                    })
+                    .collect::<Vec<_>>();
+                assert_eq!(out, expected);
+            }
+        }
+    }
 }
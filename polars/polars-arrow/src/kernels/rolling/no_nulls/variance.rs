@@ -127,6 +127,116 @@ impl<
     }
 }
 
+/// Mean and sum of squared deviations of a window.
+fn window_moments<T: NativeType + Float>(window: &[T]) -> (f64, f64) {
+    let n = window.len() as f64;
+    let mean = window.iter().map(|v| v.to_f64().unwrap()).sum::<f64>() / n;
+    let m2 = window
+        .iter()
+        .map(|v| {
+            let d = v.to_f64().unwrap() - mean;
+            d * d
+        })
+        .sum::<f64>();
+    (mean, m2)
+}
+
+/// Rolling variance (or standard deviation) over windows that are not
+/// centered.
+///
+/// The mean and the sum of squared deviations are updated with Welford's
+/// method, replacing the leaving value by the entering value in a single
+/// step. Unlike `E[x^2] - E[x]^2` this doesn't lose precision when the
+/// variance is small compared to the mean. The moments are kept in `f64` and
+/// recomputed from the window after a non-finite value has left it, and
+/// every `max(window_size, 1024)` windows to bound the accumulated error.
+/// The results can differ in the last bits from the `E[x^2] - E[x]^2`
+/// kernel that is still used for centered windows.
+fn rolling_var_fixed<T>(
+    values: &[T],
+    window_size: usize,
+    min_periods: usize,
+    take_sqrt: bool,
+) -> ArrayRef
+where
+    T: NativeType + Float,
+{
+    let len = values.len();
+    let recompute_every = std::cmp::max(window_size, 1024);
+    let finish = |m2: f64, n: usize| -> T {
+        let var = if n == 1 {
+            0.0
+        } else {
+            // variance cannot be negative.
+            // if it is negative it is due to numeric instability
+            (m2 / (n - 1) as f64).max(0.0)
+        };
+        NumCast::from(if take_sqrt { var.sqrt() } else { var }).unwrap()
+    };
+
+    let mut mean = 0.0;
+    let mut m2 = 0.0;
+    // number of NaN/inf values in the window, the output is NaN while > 0
+    let mut n_non_finite = 0;
+    // whether the moments have to be recomputed from the window
+    let mut stale = false;
+    let mut since_recompute = 0;
+
+    let mut out = Vec::with_capacity(len);
+    // windows at the start that are not yet full
+    for (i, v) in values.iter().take(window_size).enumerate() {
+        if !v.is_finite() {
+            n_non_finite += 1;
+            stale = true;
+        } else if !stale {
+            let v = v.to_f64().unwrap();
+            let delta = v - mean;
+            mean += delta / (i + 1) as f64;
+            m2 += delta * (v - mean);
+        }
+        out.push(if n_non_finite > 0 {
+            T::nan()
+        } else {
+            finish(m2, i + 1)
+        });
+    }
+    for (i, (entering, leaving)) in values.iter().skip(window_size).zip(values).enumerate() {
+        if !leaving.is_finite() {
+            n_non_finite -= 1;
+        }
+        if !entering.is_finite() {
+            n_non_finite += 1;
+        }
+        if n_non_finite > 0 {
+            stale = true;
+            out.push(T::nan());
+            continue;
+        }
+
+        since_recompute += 1;
+        if stale || since_recompute >= recompute_every {
+            (mean, m2) = window_moments(&values[i + 1..i + 1 + window_size]);
+            stale = false;
+            since_recompute = 0;
+        } else {
+            let entering = entering.to_f64().unwrap();
+            let leaving = leaving.to_f64().unwrap();
+            let delta = entering - leaving;
+            let old_mean = mean;
+            mean += delta / window_size as f64;
+            m2 += delta * (entering - mean + leaving - old_mean);
+        }
+        out.push(finish(m2, window_size));
+    }
+
+    let validity = create_validity(min_periods, len, window_size, det_offsets);
+    Box::new(PrimitiveArray::new(
+        T::PRIMITIVE.into(),
+        out.into(),
+        validity.map(|b| b.into()),
+    ))
+}
+
 pub fn rolling_var<T>(
     values: &[T],
     window_size: usize,
@@ -154,12 +264,7 @@ where
             min_periods,
             det_offsets_center,
         ),
-        (false, None) => rolling_apply_agg_window::<VarWindow<_>, _, _>(
-            values,
-            window_size,
-            min_periods,
-            det_offsets,
-        ),
+        (false, None) => rolling_var_fixed(values, window_size, min_periods, false),
         (true, Some(weights)) => {
             let weights = coerce_weights(weights);
             super::rolling_apply_weights(
@@ -248,12 +353,7 @@ where
             min_periods,
             det_offsets_center,
         ),
-        (false, None) => rolling_apply_agg_window::<StdWindow<_>, _, _>(
-            values,
-            window_size,
-            min_periods,
-            det_offsets,
-        ),
+        (false, None) => rolling_var_fixed(values, window_size, min_periods, true),
         (_, Some(_)) => {
             panic!("weights not yet supported for rolling_std")
         }
@@ -301,9 +401,25 @@ mod test {
                     Some(f64::nan()),
                     Some(f64::nan()),
                     Some(f64::nan()),
-                    Some(0.9999999999999964)
+                    Some(1.0)
                 ]
             )
         );
     }
+
+    #[test]
+    fn test_rolling_var_large_mean() {
+        // E[x^2] - E[x]^2 cancels catastrophically for these values
+        let values = (0..2000).map(|i| 1e9 + (i % 7) as f64).collect::<Vec<_>>();
+        let out = rolling_var(&values, 7, 7, false, None);
+        let out = out.as_any().downcast_ref::<PrimitiveArray<f64>>().unwrap();
+        // the variance of 0..7
+        for i in 6..values.len() {
+            assert!((out.value(i) - 14.0 / 3.0).abs() < 1e-6);
+        }
+
+        let out = rolling_std(&values, 7, 7, false, None);
+        let out = out.as_any().downcast_ref::<PrimitiveArray<f64>>().unwrap();
+        assert!((out.value(1999) - (14.0f64 / 3.0).sqrt()).abs() < 1e-6);
+    }
 }
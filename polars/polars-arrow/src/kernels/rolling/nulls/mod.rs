@@ -42,37 +42,18 @@ where
     // Safety; we are in bounds
     let mut agg_window = unsafe { Agg::new(values, validity, start, end) };
 
-    let mut validity = match create_validity(min_periods, len, window_size, det_offsets_fn) {
-        Some(v) => v,
-        None => {
-            let mut validity = MutableBitmap::with_capacity(len);
-            validity.extend_constant(len, true);
-            validity
-        }
-    };
-
+    // every window writes its value and its validity bit unconditionally,
+    // windows with too few values (including the incomplete windows at the
+    // boundaries) get a default value and an unset bit
+    let mut validity = MutableBitmap::with_capacity(len);
     let out = (0..len)
         .map(|idx| {
             let (start, end) = det_offsets_fn(idx, window_size, len);
             // safety:
             // we are in bounds
             let agg = unsafe { agg_window.update(start, end) };
-            match agg {
-                Some(val) => {
-                    if agg_window.is_valid(min_periods) {
-                        val
-                    } else {
-                        // safety: we are in bounds
-                        unsafe { validity.set_unchecked(idx, false) };
-                        T::default()
-                    }
-                }
-                None => {
-                    // safety: we are in bounds
-                    unsafe { validity.set_unchecked(idx, false) };
-                    T::default()
-                }
-            }
+            validity.push(agg.is_some() & agg_window.is_valid(min_periods));
+            agg.unwrap_or_default()
         })
         .collect_trusted::<Vec<_>>();
 
@@ -13,25 +13,29 @@ pub struct SumWindow<'a, T> {
 }
 
 impl<'a, T: NativeType + IsFloat + Add<Output = T> + Sub<Output = T>> SumWindow<'a, T> {
-    // compute sum from the entire window
-    unsafe fn compute_sum_and_null_count(&mut self, start: usize, end: usize) -> Option<T> {
-        let mut sum = None;
-        let mut idx = start;
-        self.null_count = 0;
-        for value in &self.slice[start..end] {
+    /// Sum of the valid values in `start..end` and the number of valid values.
+    ///
+    /// Null slots are added as zero instead of being skipped, so that the loop
+    /// doesn't branch on the validity, which is unpredictable for scattered nulls.
+    #[inline]
+    unsafe fn masked_sum(&self, start: usize, end: usize) -> (T, usize) {
+        let mut sum = T::default();
+        let mut valid_count = 0;
+        for idx in start..end {
             let valid = self.validity.get_bit_unchecked(idx);
-            if valid {
-                match sum {
-                    None => sum = Some(*value),
-                    Some(current) => sum = Some(*value + current),
-                }
-            } else {
-                self.null_count += 1;
-            }
-            idx += 1;
+            let value = *self.slice.get_unchecked(idx);
+            sum = sum + if valid { value } else { T::default() };
+            valid_count += valid as usize;
         }
-        self.sum = sum;
-        sum
+        (sum, valid_count)
+    }
+
+    // compute sum from the entire window
+    unsafe fn compute_sum_and_null_count(&mut self, start: usize, end: usize) -> Option<T> {
+        let (sum, valid_count) = self.masked_sum(start, end);
+        self.null_count = (end - start) - valid_count;
+        self.sum = (valid_count > 0).then_some(sum);
+        self.sum
     }
 }
 
@@ -93,18 +97,13 @@ impl<'a, T: NativeType + IsFloat + Add<Output = T> + Sub<Output = T>> RollingAgg
         if recompute_sum {
             self.compute_sum_and_null_count(start, end);
         } else {
-            for idx in self.last_end..end {
-                let valid = self.validity.get_bit_unchecked(idx);
-
-                if valid {
-                    let value = *self.slice.get_unchecked(idx);
-                    match self.sum {
-                        None => self.sum = Some(value),
-                        Some(current) => self.sum = Some(current + value),
-                    }
-                } else {
-                    // null value entering the window
-                    self.null_count += 1;
+            let (entering_sum, valid_count) = self.masked_sum(self.last_end, end);
+            // null values entering the window
+            self.null_count += end.saturating_sub(self.last_end) - valid_count;
+            if valid_count > 0 {
+                self.sum = match self.sum {
+                    None => Some(entering_sum),
+                    Some(current) => Some(current + entering_sum),
                 }
             }
         }
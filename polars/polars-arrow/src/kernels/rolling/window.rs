@@ -21,6 +21,34 @@ impl<'a, T: NativeType + IsFloat + PartialOrd> SortedBuf<'a, T> {
         }
     }
 
+    /// Replace `leaving` by `entering` in the sorted buffer.
+    ///
+    /// Only the values between the two positions are shifted, instead of
+    /// shifting the tail of the buffer once for the removal and once for the
+    /// insertion.
+    ///
+    /// # Safety
+    /// `leaving` must be present in the buffer.
+    unsafe fn replace(&mut self, leaving: T, entering: T) {
+        let remove_idx = self
+            .buf
+            .binary_search_by(|a| compare_fn_nan_max(a, &leaving))
+            .unwrap_unchecked();
+        let insertion_idx = self
+            .buf
+            .binary_search_by(|a| compare_fn_nan_max(a, &entering))
+            .unwrap_or_else(|insertion_idx| insertion_idx);
+
+        if insertion_idx > remove_idx {
+            // the removal shifts the insertion index one to the left
+            self.buf[remove_idx..insertion_idx].rotate_left(1);
+            *self.buf.get_unchecked_mut(insertion_idx - 1) = entering;
+        } else {
+            self.buf[insertion_idx..=remove_idx].rotate_right(1);
+            *self.buf.get_unchecked_mut(insertion_idx) = entering;
+        }
+    }
+
     /// Update the window position by setting the `start` index and the `end` index.
     /// # Safety
     /// The caller must ensure that `start` and `end` are within bounds of `self.slice`
@@ -30,10 +58,25 @@ impl<'a, T: NativeType + IsFloat + PartialOrd> SortedBuf<'a, T> {
         if start >= self.last_end {
             self.buf.clear();
             let new_window = self.slice.get_unchecked(start..end);
-            self.buf.extend_from_slice(new_window)
+            self.buf.extend_from_slice(new_window);
+            sort_buf(&mut self.buf);
         } else {
+            // values that leave and enter the window in pairs are swapped
+            // directly, for a fixed window this is every update
+            let n_replace = std::cmp::min(
+                start.saturating_sub(self.last_start),
+                end.saturating_sub(self.last_end),
+            );
+            for i in 0..n_replace {
+                // safety
+                // we are in bounds and the leaving value is present in buf
+                let leaving = *self.slice.get_unchecked(self.last_start + i);
+                let entering = *self.slice.get_unchecked(self.last_end + i);
+                self.replace(leaving, entering);
+            }
+
             // remove elements that should leave the window
-            for idx in self.last_start..start {
+            for idx in self.last_start + n_replace..start {
                 // safety
                 // we are in bounds
                 let val = self.slice.get_unchecked(idx);
@@ -48,7 +91,7 @@ impl<'a, T: NativeType + IsFloat + PartialOrd> SortedBuf<'a, T> {
             }
 
             // insert elements that enter the window, but insert them sorted
-            for idx in self.last_end..end {
+            for idx in self.last_end + n_replace..end {
                 // safety
                 // we are in bounds
                 let val = *self.slice.get_unchecked(idx);
@@ -244,6 +287,27 @@ mod test {
             assert_eq!(window, &[-1, 2, 6, 9]);
             let window = sorted_window.update(4, 7);
             assert_eq!(window, &[-1, 2, 9]);
+
+            // a window that doesn't overlap with the previous one
+            let mut sorted_window = SortedBuf::new(values, 0, 2);
+            let window = sorted_window.update(3, 6);
+            assert_eq!(window, &[-1, 2, 6]);
+        }
+    }
+
+    #[test]
+    fn test_sorted_buf_replace() {
+        let values = (0..200)
+            .map(|i| ((i * 37) % 101) as f64 - 50.0)
+            .collect::<Vec<_>>();
+        for window_size in [1, 2, 5, 16] {
+            let mut sorted_window = SortedBuf::new(&values, 0, window_size);
+            for start in 1..values.len() - window_size {
+                let window = unsafe { sorted_window.update(start, start + window_size) };
+                let mut expected = values[start..start + window_size].to_vec();
+                sort_buf(&mut expected);
+                assert_eq!(window, expected.as_slice());
+            }
         }
     }
 }
@@ -445,8 +445,8 @@ impl ChunkAggSeries for BooleanChunked {
 impl Utf8Chunked {
     pub(crate) fn max_str(&self) -> Option<&str> {
         match self.is_sorted_flag() {
-            IsSorted::Ascending => self.get(self.len() - 1),
-            IsSorted::Descending => self.get(0),
+            IsSorted::Ascending => self.last_non_null().and_then(|idx| self.get(idx)),
+            IsSorted::Descending => self.first_non_null().and_then(|idx| self.get(idx)),
             IsSorted::Not => self
                 .downcast_iter()
                 .filter_map(compute::aggregate::max_string)
@@ -455,8 +455,8 @@ impl Utf8Chunked {
     }
     pub(crate) fn min_str(&self) -> Option<&str> {
         match self.is_sorted_flag() {
-            IsSorted::Ascending => self.get(0),
-            IsSorted::Descending => self.get(self.len() - 1),
+            IsSorted::Ascending => self.first_non_null().and_then(|idx| self.get(idx)),
+            IsSorted::Descending => self.last_non_null().and_then(|idx| self.get(idx)),
             IsSorted::Not => self
                 .downcast_iter()
                 .filter_map(compute::aggregate::min_string)
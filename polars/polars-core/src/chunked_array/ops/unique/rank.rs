@@ -1,3 +1,4 @@
+use num_traits::PrimInt;
 use polars_arrow::prelude::FromData;
 #[cfg(feature = "random")]
 use rand::prelude::SliceRandom;
@@ -41,6 +42,66 @@ fn get_random_seed() -> u64 {
     rng.next_u64()
 }
 
+/// Stable arg sort of integer data by a least significant digit radix sort.
+///
+/// The values are mapped to unsigned keys that sort in the requested order and
+/// are sorted a byte at a time. Bytes on which all keys agree are skipped, so
+/// small values stored in a wide type only need a few passes.
+fn arg_sort_radix<T>(ca: &ChunkedArray<T>, descending: bool) -> Vec<IdxSize>
+where
+    T: PolarsIntegerType,
+    T::Native: PrimInt,
+{
+    let len = ca.len();
+    let width = std::mem::size_of::<T::Native>();
+    let min = T::Native::min_value();
+    let signed = min < T::Native::zero();
+    let min = min.to_i64().unwrap();
+    let mask = u64::MAX >> (64 - 8 * width);
+
+    let mut keys: Vec<(u64, IdxSize)> = Vec::with_capacity(len);
+    let mut hist = vec![[0usize; 256]; width];
+    keys.extend(ca.into_no_null_iter().zip(0 as IdxSize..).map(|(v, i)| {
+        // shift signed values so that the minimum maps to 0
+        let key = if signed {
+            v.to_i64().unwrap().wrapping_sub(min) as u64
+        } else {
+            v.to_u64().unwrap()
+        };
+        let key = if descending { key ^ mask } else { key };
+        for (byte, counts) in hist.iter_mut().enumerate() {
+            counts[((key >> (8 * byte)) & 0xFF) as usize] += 1;
+        }
+        (key, i)
+    }));
+
+    let mut buf = vec![(0u64, 0 as IdxSize); len];
+    for (byte, counts) in hist.iter().enumerate() {
+        if counts.iter().any(|&count| count == len) {
+            continue;
+        }
+        let mut offsets = [0usize; 256];
+        let mut offset = 0;
+        for (o, &count) in offsets.iter_mut().zip(counts.iter()) {
+            *o = offset;
+            offset += count;
+        }
+        let shift = 8 * byte;
+        for &(key, i) in &keys {
+            let digit = ((key >> shift) & 0xFF) as usize;
+            // Safety:
+            // the offsets of a digit stay below the start of the next digit
+            unsafe {
+                let o = offsets.get_unchecked_mut(digit);
+                *buf.get_unchecked_mut(*o) = (key, i);
+                *o += 1;
+            }
+        }
+        std::mem::swap(&mut keys, &mut buf);
+    }
+    keys.into_iter().map(|(_, i)| i).collect()
+}
+
 pub(crate) fn rank(s: &Series, method: RankMethod, descending: bool, seed: Option<u64>) -> Series {
     match s.len() {
         1 => {
@@ -85,10 +146,34 @@ pub(crate) fn rank(s: &Series, method: RankMethod, descending: bool, seed: Optio
 
     let len = s.len();
     let null_count = s.null_count();
-    let sort_idx_ca = s.arg_sort(SortOptions {
-        descending,
-        ..Default::default()
-    });
+    let phys = s.to_physical_repr();
+    // the physical integer dispatch only has arms for the integer types that
+    // are compiled in, anything else goes through `arg_sort`
+    let use_radix = (s.dtype().is_integer() || s.dtype().is_temporal())
+        && match phys.dtype() {
+            DataType::Int32 | DataType::Int64 | DataType::UInt32 | DataType::UInt64 => true,
+            #[cfg(feature = "dtype-i8")]
+            DataType::Int8 => true,
+            #[cfg(feature = "dtype-i16")]
+            DataType::Int16 => true,
+            #[cfg(feature = "dtype-u8")]
+            DataType::UInt8 => true,
+            #[cfg(feature = "dtype-u16")]
+            DataType::UInt16 => true,
+            _ => false,
+        };
+    let sort_idx_ca = if use_radix {
+        let sort_idx = with_match_physical_integer_polars_type!(phys.dtype(), |$T| {
+            let ca: &ChunkedArray<$T> = phys.as_ref().as_ref().as_ref();
+            arg_sort_radix(ca, descending)
+        });
+        IdxCa::from_vec(s.name(), sort_idx)
+    } else {
+        s.arg_sort(SortOptions {
+            descending,
+            ..Default::default()
+        })
+    };
     let sort_idx = sort_idx_ca.downcast_iter().next().unwrap().values();
 
     let mut inv: Vec<IdxSize> = Vec::with_capacity(len);
@@ -446,6 +531,76 @@ mod test {
         assert_eq!(out.dtype(), &IDX_DTYPE);
     }
 
+    #[test]
+    fn test_arg_sort_radix() {
+        let ca = Int64Chunked::from_slice(
+            "",
+            &[3, -1, 1 << 40, 0, -1, i64::MIN, 3, i64::MAX, -(1 << 20), 0],
+        );
+        for descending in [false, true] {
+            let expected = ca.arg_sort(SortOptions {
+                descending,
+                ..Default::default()
+            });
+            let expected = expected.into_no_null_iter().collect::<Vec<_>>();
+            assert_eq!(arg_sort_radix(&ca, descending), expected);
+        }
+    }
+
+    #[test]
+    #[cfg(feature = "dtype-i8")]
+    fn test_rank_i8() -> PolarsResult<()> {
+        let s = Int8Chunked::new(
+            "",
+            &[
+                Some(3),
+                None,
+                Some(-2),
+                Some(3),
+                Some(-100),
+                Some(0),
+                Some(-2),
+            ],
+        )
+        .into_series();
+        let idx_rank = |method, descending| -> PolarsResult<Vec<Option<IdxSize>>> {
+            Ok(rank(&s, method, descending, None)
+                .idx()?
+                .into_iter()
+                .collect())
+        };
+
+        let expected: [(RankMethod, bool, [IdxSize; 6]); 8] = [
+            (RankMethod::Min, false, [5, 2, 5, 1, 4, 2]),
+            (RankMethod::Max, false, [6, 3, 6, 1, 4, 3]),
+            (RankMethod::Dense, false, [4, 2, 4, 1, 3, 2]),
+            (RankMethod::Ordinal, false, [5, 2, 6, 1, 4, 3]),
+            (RankMethod::Min, true, [1, 4, 1, 6, 3, 4]),
+            (RankMethod::Max, true, [2, 5, 2, 6, 3, 5]),
+            (RankMethod::Dense, true, [1, 3, 1, 4, 2, 3]),
+            (RankMethod::Ordinal, true, [1, 4, 2, 6, 3, 5]),
+        ];
+        for (method, descending, ranks) in expected {
+            let mut ranks = ranks.map(Some).to_vec();
+            ranks.insert(1, None);
+            assert_eq!(idx_rank(method, descending)?, ranks);
+        }
+
+        for (descending, ranks) in [
+            (false, [5.5f32, 2.5, 5.5, 1.0, 4.0, 2.5]),
+            (true, [1.5, 4.5, 1.5, 6.0, 3.0, 4.5]),
+        ] {
+            let mut ranks = ranks.map(Some).to_vec();
+            ranks.insert(1, None);
+            let out = rank(&s, RankMethod::Average, descending, None)
+                .f32()?
+                .into_iter()
+                .collect::<Vec<_>>();
+            assert_eq!(out, ranks);
+        }
+        Ok(())
+    }
+
     #[test]
     fn test_rank_reverse() -> PolarsResult<()> {
         let s = Series::new("", &[None, Some(1), Some(1), Some(5), None]);
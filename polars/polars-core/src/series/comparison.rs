@@ -14,6 +14,13 @@ use crate::apply_method_physical_numeric;
 use crate::prelude::*;
 use crate::series::arithmetic::coerce_lhs_rhs;
 
+/// The `*_missing` comparisons only differ from the regular ones in how they
+/// treat nulls, so flat data without nulls can use the cheaper kernels.
+fn has_missing_values(lhs: &Series, rhs: &Series) -> bool {
+    let is_flat = |s: &Series| s.dtype().is_primitive() || s.dtype().is_temporal();
+    lhs.null_count() > 0 || rhs.null_count() > 0 || !is_flat(lhs) || !is_flat(rhs)
+}
+
 macro_rules! impl_compare {
     ($self:expr, $rhs:expr, $method:ident) => {{
         let (lhs, rhs) = coerce_lhs_rhs($self, $rhs).expect("cannot coerce datatypes");
@@ -168,6 +175,9 @@ impl ChunkCompare<&Series> for Series {
     /// Create a boolean mask by checking for equality.
     fn equal_missing(&self, rhs: &Series) -> PolarsResult<BooleanChunked> {
         validate_types(self.dtype(), rhs.dtype())?;
+        if !has_missing_values(self, rhs) {
+            return ChunkCompare::<&Series>::equal(self, rhs);
+        }
         use DataType::*;
         let mut out = match (self.dtype(), rhs.dtype(), self.len(), rhs.len()) {
             #[cfg(feature = "dtype-categorical")]
@@ -280,6 +290,9 @@ impl ChunkCompare<&Series> for Series {
     /// Create a boolean mask by checking for inequality.
     fn not_equal_missing(&self, rhs: &Series) -> PolarsResult<BooleanChunked> {
         validate_types(self.dtype(), rhs.dtype())?;
+        if !has_missing_values(self, rhs) {
+            return ChunkCompare::<&Series>::not_equal(self, rhs);
+        }
         use DataType::*;
         let mut out = match (self.dtype(), rhs.dtype(), self.len(), rhs.len()) {
             #[cfg(feature = "dtype-categorical")]
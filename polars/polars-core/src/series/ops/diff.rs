@@ -12,7 +12,30 @@ impl Series {
         };
 
         match null_behavior {
-            NullBehavior::Ignore => Ok(&s - &s.shift(n)),
+            NullBehavior::Ignore => {
+                let len = s.len();
+                let n_abs = n.unsigned_abs() as usize;
+                if n == 0 || n_abs >= len {
+                    return Ok(&s - &s.shift(n));
+                }
+                // subtract the overlapping (zero-copy) slices and pad with
+                // nulls, instead of materializing a shifted copy of `s`
+                let out_len = len - n_abs;
+                let diff = if n > 0 {
+                    &s.slice(n, out_len) - &s.slice(0, out_len)
+                } else {
+                    &s.slice(0, out_len) - &s.slice(n_abs as i64, out_len)
+                };
+                let mut nulls = Series::full_null(s.name(), n_abs, diff.dtype());
+                if n > 0 {
+                    nulls.append(&diff)?;
+                    Ok(nulls)
+                } else {
+                    let mut diff = diff;
+                    diff.append(&nulls)?;
+                    Ok(diff)
+                }
+            }
             NullBehavior::Drop => {
                 polars_ensure!(n > 0, InvalidOperation: "only positive integer allowed if nulls are dropped in 'diff' operation");
                 let n = n as usize;
@@ -26,6 +26,33 @@ fn reshape_fast_path(name: &str, s: &Series) -> Series {
     ca.into_series()
 }
 
+fn reshape_equal_width(name: &str, s: &Series, rows: usize, cols: i64) -> Series {
+    let s = s.rechunk();
+    let values = s.array_ref(0).clone();
+
+    let offsets = (0..=rows as i64).map(|i| i * cols).collect::<Vec<_>>();
+    let data_type = ListArray::<i64>::default_datatype(values.data_type().clone());
+    // Safety:
+    // offsets are monotonically increasing and end at `values.len()`.
+    let arr = unsafe {
+        ListArray::new(
+            data_type,
+            Offsets::new_unchecked(offsets).into(),
+            values,
+            None,
+        )
+    };
+
+    // safety dtype is checked.
+    let mut ca = unsafe { ListChunked::from_chunks(name, vec![Box::new(arr)]) };
+    ca.set_inner_dtype(s.dtype().clone());
+    // empty lists explode to nulls, so only the non-empty case can use the fast path
+    if cols > 0 {
+        ca.set_fast_explode();
+    }
+    ca.into_series()
+}
+
 impl Series {
     /// Convert the values of this Series to a ListChunked with a length of 1,
     /// So a Series of:
@@ -113,6 +140,16 @@ impl Series {
                     return Ok(s);
                 }
 
+                // all rows have the same length, so for flat physical types we only
+                // have to create the offsets; the values buffer is shared with the input
+                let dtype = s_ref.dtype();
+                if dtype.is_numeric()
+                    || matches!(dtype, DataType::Boolean | DataType::Utf8 | DataType::Binary)
+                {
+                    let s = reshape_equal_width(self.name(), s_ref, rows as usize, cols);
+                    return Ok(s);
+                }
+
                 let mut builder =
                     get_list_builder(s_ref.dtype(), s_ref.len(), rows as usize, self.name())?;
 
@@ -167,6 +204,40 @@ mod test {
             assert_eq!(out.explode()?.len(), 4);
         }
 
+        let out = s.reshape(&[2, 2])?;
+        let out = out.list()?;
+        assert!(out.get(0).unwrap().series_equal(&Series::new("", &[1, 2])));
+        assert!(out.get(1).unwrap().series_equal(&Series::new("", &[3, 4])));
+
+        // all rows are empty lists, which explode to nulls
+        let s = Series::new_empty("a", &DataType::Int32);
+        let out = s.reshape(&[3, 0])?;
+        assert_eq!(out.len(), 3);
+        assert!(!out.list()?._can_fast_explode());
+        let exploded = out.explode()?;
+        assert_eq!(exploded.len(), 3);
+        assert_eq!(exploded.null_count(), 3);
+
+        Ok(())
+    }
+
+    #[test]
+    #[cfg(feature = "dtype-struct")]
+    fn test_reshape_struct() -> PolarsResult<()> {
+        let s = StructChunked::new(
+            "a",
+            &[
+                Series::new("x", &[1, 2, 3, 4]),
+                Series::new("y", &["a", "b", "c", "d"]),
+            ],
+        )?
+        .into_series();
+
+        let out = s.reshape(&[2, 2])?;
+        assert_eq!(out.len(), 2);
+        assert_eq!(out.dtype(), &DataType::List(Box::new(s.dtype().clone())));
+        assert!(out.explode()?.series_equal(&s));
+
         Ok(())
     }
 }
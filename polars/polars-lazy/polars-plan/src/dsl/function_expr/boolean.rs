@@ -1,9 +1,7 @@
 use std::ops::Not;
 
 use super::*;
-use crate::map;
-#[cfg(feature = "is_in")]
-use crate::wrap;
+use crate::{map, wrap};
 
 #[cfg_attr(feature = "serde", derive(Serialize, Deserialize))]
 #[derive(Clone, PartialEq, Debug, Eq, Hash)]
@@ -25,6 +23,10 @@ pub enum BooleanFunction {
     IsDuplicated,
     #[cfg(feature = "is_in")]
     IsIn,
+    IsBetween {
+        lower_inclusive: bool,
+        upper_inclusive: bool,
+    },
 }
 
 impl BooleanFunction {
@@ -54,6 +56,7 @@ impl Display for BooleanFunction {
             IsDuplicated => "is_duplicated",
             #[cfg(feature = "is_in")]
             IsIn => "is_in",
+            IsBetween { .. } => "is_between",
         };
         write!(f, "{s}")
     }
@@ -80,6 +83,15 @@ impl From<BooleanFunction> for SpecialEq<Arc<dyn SeriesUdf>> {
             IsDuplicated => map!(is_duplicated),
             #[cfg(feature = "is_in")]
             IsIn => wrap!(is_in),
+            IsBetween {
+                lower_inclusive,
+                upper_inclusive,
+            } => {
+                let f = move |s: &mut [Series]| {
+                    is_between(s, lower_inclusive, upper_inclusive).map(Some)
+                };
+                wrap!(f)
+            }
         }
     }
 }
@@ -157,3 +169,8 @@ fn is_in(s: &mut [Series]) -> PolarsResult<Option<Series>> {
     let other = &s[1];
     left.is_in(other).map(|ca| Some(ca.into_series()))
 }
+
+fn is_between(s: &[Series], lower_inclusive: bool, upper_inclusive: bool) -> PolarsResult<Series> {
+    polars_ops::prelude::is_between(&s[0], &s[1], &s[2], lower_inclusive, upper_inclusive)
+        .map(|ca| ca.into_series())
+}
@@ -1,41 +1,42 @@
-use polars_core::export::num;
-use DataType::*;
+use polars_arrow::utils::CustomIterTools;
+use polars_core::export::arrow::array::PrimitiveArray;
+use polars_core::export::arrow::bitmap::Bitmap;
+use polars_core::with_match_physical_numeric_polars_type;
 
 use super::*;
 
 pub(super) fn sign(s: &Series) -> PolarsResult<Series> {
-    match s.dtype() {
-        Float32 => {
-            let ca = s.f32().unwrap();
-            sign_float(ca)
-        }
-        Float64 => {
-            let ca = s.f64().unwrap();
-            sign_float(ca)
-        }
-        dt if dt.is_numeric() => {
-            let s = s.cast(&Float64)?;
-            sign(&s)
-        }
-        dt => polars_bail!(opq = sign, dt),
-    }
+    let dt = s.dtype();
+    polars_ensure!(dt.is_numeric(), opq = sign, dt);
+    with_match_physical_numeric_polars_type!(dt, |$T| {
+        let ca: &ChunkedArray<$T> = s.as_ref().as_ref().as_ref();
+        Ok(sign_numeric(ca).into_series())
+    })
 }
 
-fn sign_float<T>(ca: &ChunkedArray<T>) -> PolarsResult<Series>
-where
-    T: PolarsFloatType,
-    T::Native: num::Float,
-    ChunkedArray<T>: IntoSeries,
-{
-    ca.apply(signum_improved).into_series().cast(&Int64)
-}
-
-// Wrapper for the signum function that handles +/-0.0 inputs differently
-// See discussion here: https://github.com/rust-lang/rust/issues/57543
-fn signum_improved<F: num::Float>(v: F) -> F {
-    if v.is_zero() {
-        v
-    } else {
-        v.signum()
-    }
+/// The sign is computed branch-free, straight into the `Int64` output, for
+/// every numeric type; `-0.0` has sign `0` and NaN has no sign and is null.
+fn sign_numeric<T: PolarsNumericType>(ca: &ChunkedArray<T>) -> Int64Chunked {
+    ca.apply_kernel_cast(&|arr| {
+        let zero = T::Native::zero();
+        let values = arr
+            .values()
+            .iter()
+            .map(|&v| (v > zero) as i64 - (v < zero) as i64)
+            .collect_trusted::<Vec<_>>();
+        let validity = if T::Native::is_float() && arr.values().iter().any(|v| v.is_nan()) {
+            let not_nan = Bitmap::from_trusted_len_iter(arr.values().iter().map(|v| !v.is_nan()));
+            match arr.validity() {
+                Some(validity) => Some(validity & &not_nan),
+                None => Some(not_nan),
+            }
+        } else {
+            arr.validity().cloned()
+        };
+        Box::new(PrimitiveArray::new(
+            ArrowDataType::Int64,
+            values.into(),
+            validity,
+        ))
+    })
 }
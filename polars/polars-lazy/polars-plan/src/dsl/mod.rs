@@ -1045,6 +1045,28 @@ impl Expr {
         }
     }
 
+    /// Check if the values of this expression lie between `lower` and `upper`.
+    ///
+    /// The `*_inclusive` flags define which sides of the interval are closed.
+    #[allow(clippy::wrong_self_convention)]
+    pub fn is_between<E: Into<Expr>>(
+        self,
+        lower: E,
+        upper: E,
+        lower_inclusive: bool,
+        upper_inclusive: bool,
+    ) -> Self {
+        self.map_many_private(
+            BooleanFunction::IsBetween {
+                lower_inclusive,
+                upper_inclusive,
+            }
+            .into(),
+            &[lower.into(), upper.into()],
+            true,
+        )
+    }
+
     /// Sort this column by the ordering of another column.
     /// Can also be used in a groupby context to sort the groups.
     pub fn sort_by<E: AsRef<[IE]>, IE: Into<Expr> + Clone, R: AsRef<[bool]>>(
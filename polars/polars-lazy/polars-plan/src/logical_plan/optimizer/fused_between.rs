@@ -0,0 +1,108 @@
+use super::*;
+
+/// Replaces `(col >= lower) & (col <= upper)` (in either order and with any
+/// closedness) by a single `is_between` function, so that the column is only
+/// traversed once and no intermediate boolean masks are materialized.
+pub struct FusedBetween {}
+
+/// Returns the column name, whether the bound is the lower bound, whether it is
+/// inclusive and the node of the bound.
+fn get_bound(node: Node, expr_arena: &Arena<AExpr>) -> Option<(Arc<str>, bool, bool, Node)> {
+    use AExpr::*;
+    let BinaryExpr { left, op, right } = expr_arena.get(node) else {
+        return None;
+    };
+    let Column(name) = expr_arena.get(*left) else {
+        return None;
+    };
+    if !is_scalar_literal(*right, expr_arena) {
+        return None;
+    }
+    let (is_lower, inclusive) = match op {
+        Operator::GtEq => (true, true),
+        Operator::Gt => (true, false),
+        Operator::LtEq => (false, true),
+        Operator::Lt => (false, false),
+        _ => return None,
+    };
+    Some((name.clone(), is_lower, inclusive, *right))
+}
+
+fn is_scalar_literal(node: Node, expr_arena: &Arena<AExpr>) -> bool {
+    match expr_arena.get(node) {
+        AExpr::Literal(LiteralValue::Series(_) | LiteralValue::Range { .. }) => false,
+        AExpr::Literal(_) => true,
+        AExpr::Cast { expr, .. } => is_scalar_literal(*expr, expr_arena),
+        _ => false,
+    }
+}
+
+/// Only rewrite in nodes that evaluate their expressions element-wise on the
+/// input. Predicates of file scans are kept as is, as they are used to
+/// evaluate statistics.
+fn get_schema(lp_node: Node, lp_arena: &Arena<ALogicalPlan>) -> Option<SchemaRef> {
+    use ALogicalPlan::*;
+    match lp_arena.get(lp_node) {
+        DataFrameScan { schema, .. } => Some(schema.clone()),
+        Selection { input, .. }
+        | Projection { input, .. }
+        | LocalProjection { input, .. }
+        | HStack { input, .. } => Some(lp_arena.get(*input).schema(lp_arena).into_owned()),
+        _ => None,
+    }
+}
+
+impl OptimizationRule for FusedBetween {
+    fn optimize_expr(
+        &self,
+        expr_arena: &mut Arena<AExpr>,
+        expr_node: Node,
+        lp_arena: &Arena<ALogicalPlan>,
+        lp_node: Node,
+    ) -> PolarsResult<Option<AExpr>> {
+        let AExpr::BinaryExpr {
+            left,
+            op: Operator::And,
+            right,
+        } = expr_arena.get(expr_node)
+        else {
+            return Ok(None);
+        };
+        let (Some((name_a, lower_a, incl_a, bound_a)), Some((name_b, lower_b, incl_b, bound_b))) =
+            (get_bound(*left, expr_arena), get_bound(*right, expr_arena))
+        else {
+            return Ok(None);
+        };
+        if name_a != name_b || lower_a == lower_b {
+            return Ok(None);
+        }
+        let Some(schema) = get_schema(lp_node, lp_arena) else {
+            return Ok(None);
+        };
+        match schema.get(&name_a) {
+            Some(dtype) if dtype.is_numeric() => {}
+            _ => return Ok(None),
+        }
+        let ((lower, lower_inclusive), (upper, upper_inclusive)) = if lower_a {
+            ((bound_a, incl_a), (bound_b, incl_b))
+        } else {
+            ((bound_b, incl_b), (bound_a, incl_a))
+        };
+
+        // the column is the first input, so the output name is preserved
+        let column = expr_arena.add(AExpr::Column(name_a));
+        Ok(Some(AExpr::Function {
+            input: vec![column, lower, upper],
+            function: FunctionExpr::Boolean(BooleanFunction::IsBetween {
+                lower_inclusive,
+                upper_inclusive,
+            }),
+            options: FunctionOptions {
+                collect_groups: ApplyOptions::ApplyFlat,
+                auto_explode: true,
+                cast_to_supertypes: true,
+                ..Default::default()
+            },
+        }))
+    }
+}
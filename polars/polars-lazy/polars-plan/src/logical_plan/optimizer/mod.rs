@@ -15,6 +15,7 @@ pub(crate) mod file_caching;
 mod flatten_union;
 #[cfg(feature = "fused")]
 mod fused;
+mod fused_between;
 mod predicate_pushdown;
 mod projection_pushdown;
 mod simplify_expr;
@@ -28,6 +29,7 @@ use drop_nulls::ReplaceDropNulls;
 use fast_projection::FastProjectionAndCollapse;
 #[cfg(any(feature = "ipc", feature = "parquet", feature = "csv"))]
 use file_caching::{find_column_union_and_fingerprints, FileCacher};
+use fused_between::FusedBetween;
 pub use predicate_pushdown::PredicatePushDown;
 pub use projection_pushdown::ProjectionPushDown;
 pub use simplify_expr::{SimplifyBooleanRule, SimplifyExprRule};
@@ -95,6 +97,7 @@ pub fn optimize(
         rules.push(Box::new(SimplifyExprRule {}));
         #[cfg(feature = "fused")]
         rules.push(Box::new(fused::FusedArithmetic {}));
+        rules.push(Box::new(FusedBetween {}));
     }
 
     // should be run before predicate pushdown
@@ -435,6 +435,120 @@ fn get_string_concat_input(node: Node, expr_arena: &Arena<AExpr>) -> Option<&[No
     }
 }
 
+/// Whether clipping a column of `dtype` to `bound` can never change a value,
+/// e.g. `clip_min(-inf)` on floats or `clip_max(i32::MAX)` on `Int32`.
+#[cfg(feature = "round_series")]
+fn is_noop_clip_bound(bound: &AnyValue, dtype: &DataType, is_min: bool) -> bool {
+    macro_rules! is_extreme {
+        ($T:ty) => {
+            bound.extract::<$T>() == Some(if is_min { <$T>::MIN } else { <$T>::MAX })
+        };
+    }
+    match dtype {
+        DataType::Float32 | DataType::Float64 => {
+            bound.extract::<f64>()
+                == Some(if is_min {
+                    f64::NEG_INFINITY
+                } else {
+                    f64::INFINITY
+                })
+        }
+        DataType::UInt8 => is_extreme!(u8),
+        #[cfg(feature = "dtype-u16")]
+        DataType::UInt16 => is_extreme!(u16),
+        DataType::UInt32 => is_extreme!(u32),
+        DataType::UInt64 => is_extreme!(u64),
+        #[cfg(feature = "dtype-i8")]
+        DataType::Int8 => is_extreme!(i8),
+        #[cfg(feature = "dtype-i16")]
+        DataType::Int16 => is_extreme!(i16),
+        DataType::Int32 => is_extreme!(i32),
+        DataType::Int64 => is_extreme!(i64),
+        _ => false,
+    }
+}
+
+/// Removes the bounds of a `clip` that cannot change any value of its input,
+/// the `clip` is dropped entirely if neither bound is left.
+#[cfg(feature = "round_series")]
+fn drop_noop_clip_bounds(
+    input: Node,
+    min: &Option<AnyValue<'static>>,
+    max: &Option<AnyValue<'static>>,
+    options: FunctionOptions,
+    expr_arena: &Arena<AExpr>,
+    lp_arena: &Arena<ALogicalPlan>,
+    lp_node: Node,
+) -> Option<AExpr> {
+    let schema = lp_arena
+        .get(lp_arena.get(lp_node).get_input()?)
+        .schema(lp_arena);
+    let dtype = expr_arena
+        .get(input)
+        .get_type(&schema, Context::Default, expr_arena)
+        .ok()?;
+    let keep = |bound: &Option<AnyValue<'static>>, is_min: bool| {
+        bound
+            .as_ref()
+            .filter(|bound| !is_noop_clip_bound(bound, &dtype, is_min))
+            .cloned()
+    };
+    let (new_min, new_max) = (keep(min, true), keep(max, false));
+    match (new_min, new_max) {
+        (None, None) => Some(expr_arena.get(input).clone()),
+        (new_min, new_max)
+            if new_min.is_some() != min.is_some() || new_max.is_some() != max.is_some() =>
+        {
+            Some(AExpr::Function {
+                input: vec![input],
+                function: FunctionExpr::Clip {
+                    min: new_min,
+                    max: new_max,
+                },
+                options,
+            })
+        }
+        _ => None,
+    }
+}
+
+/// `clip_min(l).clip_max(u)` and `clip_max(u).clip_min(l)` => `clip(l, u)`
+#[cfg(feature = "round_series")]
+fn fuse_clip(
+    input: Node,
+    min: &Option<AnyValue<'static>>,
+    max: &Option<AnyValue<'static>>,
+    options: FunctionOptions,
+    expr_arena: &Arena<AExpr>,
+) -> Option<AExpr> {
+    let AExpr::Function {
+        input: inner_input,
+        function:
+            FunctionExpr::Clip {
+                min: inner_min,
+                max: inner_max,
+            },
+        ..
+    } = expr_arena.get(input)
+    else {
+        return None;
+    };
+    let (min, max) = match (min, max, inner_min, inner_max) {
+        (None, Some(max), Some(min), None) | (Some(min), None, None, Some(max)) => (min, max),
+        _ => return None,
+    };
+    // `clip` panics on crossed bounds, so those chains are kept as they are
+    let (lower, upper) = (min.extract::<f64>()?, max.extract::<f64>()?);
+    (lower <= upper).then(|| AExpr::Function {
+        input: inner_input.clone(),
+        function: FunctionExpr::Clip {
+            min: Some(min.clone()),
+            max: Some(max.clone()),
+        },
+        options,
+    })
+}
+
 pub struct SimplifyExprRule {}
 
 impl OptimizationRule for SimplifyExprRule {
@@ -629,6 +743,15 @@ impl OptimizationRule for SimplifyExprRule {
                 // faster casts (we only do strict casts)
                 inline_cast(input, data_type)
             }
+            #[cfg(feature = "round_series")]
+            AExpr::Function {
+                input,
+                function: FunctionExpr::Clip { min, max },
+                options,
+            } => drop_noop_clip_bounds(
+                input[0], min, max, *options, expr_arena, _lp_arena, _lp_node,
+            )
+            .or_else(|| fuse_clip(input[0], min, max, *options, expr_arena)),
             // flatten nested concat_str calls
             #[cfg(all(feature = "strings", feature = "concat_str"))]
             AExpr::Function {
@@ -37,6 +37,32 @@ pub(crate) fn eval_field_to_dtype(f: &Field, expr: &Expr, list: bool) -> Field {
     }
 }
 
+/// `cumulative_eval` of a plain `min`, `max` or `sum` of the element is the
+/// cumulative aggregation of the column, which only needs a single pass.
+/// Returns `None` if the expression or the data don't allow that.
+#[cfg(feature = "cum_agg")]
+fn cumulative_agg(s: &Series, expr: &Expr, min_periods: usize) -> Option<Series> {
+    // the aggregations skip nulls, whereas the cumulative kernels keep them
+    if s.null_count() > 0 || !s.dtype().is_integer() {
+        return None;
+    }
+    let is_element = |input: &Expr| matches!(input, Expr::Column(name) if name.is_empty());
+    let out = match expr {
+        Expr::Agg(AggExpr::Min { input, .. }) if is_element(input) => s.cummin(false),
+        Expr::Agg(AggExpr::Max { input, .. }) if is_element(input) => s.cummax(false),
+        Expr::Agg(AggExpr::Sum(input)) if is_element(input) => s.cumsum(false),
+        _ => return None,
+    };
+    if min_periods <= 1 {
+        return Some(out);
+    }
+    let n_nulls = std::cmp::min(min_periods - 1, out.len());
+    let mut head = Series::full_null(out.name(), n_nulls, out.dtype());
+    head.append(&out.slice(n_nulls as i64, out.len() - n_nulls))
+        .ok()?;
+    Some(head)
+}
+
 pub trait ExprEvalExtension: IntoExpr + Sized {
     /// Run an expression over a sliding window that increases `1` slot every iteration.
     ///
@@ -53,6 +79,13 @@ pub trait ExprEvalExtension: IntoExpr + Sized {
             // ensure we get the new schema
             let output_field = eval_field_to_dtype(s.field().as_ref(), &expr, false);
 
+            #[cfg(feature = "cum_agg")]
+            if let Some(out) = cumulative_agg(&s, &expr, min_periods) {
+                let mut out = out.cast(output_field.data_type())?;
+                out.rename(&name);
+                return Ok(Some(out));
+            }
+
             let expr = expr.clone();
             let mut arena = Arena::with_capacity(10);
             let aexpr = to_aexpr(expr, &mut arena);
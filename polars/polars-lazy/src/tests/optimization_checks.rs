@@ -577,3 +577,128 @@ fn test_flatten_unions() -> PolarsResult<()> {
     }
     Ok(())
 }
+
+#[test]
+fn test_chained_comparison_to_is_between() -> PolarsResult<()> {
+    let df = df![
+        "a" => [1, 2, 3, 4, 5],
+    ]?;
+
+    let q = df
+        .lazy()
+        .select([(col("a").gt_eq(lit(2)).and(col("a").lt(lit(4))))]);
+
+    let (mut expr_arena, mut lp_arena) = get_arenas();
+    let lp = q.clone().optimize(&mut lp_arena, &mut expr_arena).unwrap();
+
+    assert!((&expr_arena)
+        .iter(lp_arena.get(lp).get_exprs()[0])
+        .any(|(_, e)| matches!(
+            e,
+            AExpr::Function {
+                function: FunctionExpr::Boolean(BooleanFunction::IsBetween {
+                    lower_inclusive: true,
+                    upper_inclusive: false
+                }),
+                ..
+            }
+        )));
+
+    let out = q.collect()?;
+    let a = out.column("a")?;
+    assert_eq!(
+        Vec::from(a.bool()?),
+        &[
+            Some(false),
+            Some(true),
+            Some(true),
+            Some(false),
+            Some(false)
+        ]
+    );
+
+    Ok(())
+}
+
+#[test]
+#[cfg(feature = "round_series")]
+fn test_chained_clip_to_clip() -> PolarsResult<()> {
+    let df = df![
+        "a" => [1, 2, 3, 4, 5],
+    ]?;
+
+    let q = df.lazy().select([col("a")
+        .clip_min(AnyValue::Int32(2))
+        .clip_max(AnyValue::Int32(4))]);
+
+    let (mut expr_arena, mut lp_arena) = get_arenas();
+    let lp = q.clone().optimize(&mut lp_arena, &mut expr_arena).unwrap();
+
+    assert!((&expr_arena)
+        .iter(lp_arena.get(lp).get_exprs()[0])
+        .any(|(_, e)| matches!(
+            e,
+            AExpr::Function {
+                function: FunctionExpr::Clip {
+                    min: Some(_),
+                    max: Some(_)
+                },
+                ..
+            }
+        )));
+
+    let out = q.collect()?;
+    let a = out.column("a")?;
+    assert_eq!(
+        Vec::from(a.i32()?),
+        &[Some(2), Some(2), Some(3), Some(4), Some(4)]
+    );
+
+    Ok(())
+}
+
+#[test]
+#[cfg(feature = "round_series")]
+fn test_drop_noop_clip_bounds() -> PolarsResult<()> {
+    let df = df![
+        "a" => [1, 2, 3, 4, 5],
+        "b" => [1.0, 2.0, 3.0, 4.0, 5.0],
+    ]?;
+
+    let q = df.lazy().select([
+        col("a").clip(AnyValue::Int32(i32::MIN), AnyValue::Int32(3)),
+        col("b").clip_min(AnyValue::Float64(f64::NEG_INFINITY)),
+    ]);
+
+    let (mut expr_arena, mut lp_arena) = get_arenas();
+    let lp = q.clone().optimize(&mut lp_arena, &mut expr_arena).unwrap();
+    let exprs = lp_arena.get(lp).get_exprs();
+
+    // the lower bound of `a` is dropped
+    assert!((&expr_arena).iter(exprs[0]).any(|(_, e)| matches!(
+        e,
+        AExpr::Function {
+            function: FunctionExpr::Clip {
+                min: None,
+                max: Some(_)
+            },
+            ..
+        }
+    )));
+    // the clip on `b` is dropped entirely
+    assert!(!(&expr_arena)
+        .iter(exprs[1])
+        .any(|(_, e)| matches!(e, AExpr::Function { .. })));
+
+    let out = q.collect()?;
+    assert_eq!(
+        Vec::from(out.column("a")?.i32()?),
+        &[Some(1), Some(2), Some(3), Some(3), Some(3)]
+    );
+    assert_eq!(
+        Vec::from(out.column("b")?.f64()?),
+        &[Some(1.0), Some(2.0), Some(3.0), Some(4.0), Some(5.0)]
+    );
+
+    Ok(())
+}
@@ -1888,3 +1888,44 @@ fn test_partitioned_gb_ternary() -> PolarsResult<()> {
 
     Ok(())
 }
+
+#[test]
+fn test_is_between() -> PolarsResult<()> {
+    let df = df![
+        "a" => [Some(1i64), Some(2), None, Some(4), Some(5)],
+        "lower" => [0i64, 2, 2, 2, 6],
+    ]?;
+
+    let out = df
+        .lazy()
+        .select([
+            col("a")
+                .is_between(lit(2i64), lit(4i64), true, true)
+                .alias("both"),
+            col("a")
+                .is_between(lit(2i64), lit(4i64), false, false)
+                .alias("none"),
+            col("a")
+                .is_between(col("lower"), lit(4i64), true, false)
+                .alias("expr"),
+        ])
+        .collect()?;
+
+    let both = out.column("both")?.bool()?;
+    assert_eq!(
+        Vec::from(both),
+        &[Some(false), Some(true), None, Some(true), Some(false)]
+    );
+    let none = out.column("none")?.bool()?;
+    assert_eq!(
+        Vec::from(none),
+        &[Some(false), Some(false), None, Some(false), Some(false)]
+    );
+    let expr = out.column("expr")?.bool()?;
+    assert_eq!(
+        Vec::from(expr),
+        &[Some(true), Some(true), None, Some(false), Some(false)]
+    );
+
+    Ok(())
+}
@@ -1,5 +1,5 @@
 use arrow::array::{Array, PrimitiveArray};
-use num::NumCast;
+use num::{NumCast, PrimInt};
 use polars_arrow::prelude::ArrayRef;
 use polars_arrow::utils::combine_validities_and;
 use polars_core::datatypes::PolarsNumericType;
@@ -8,7 +8,11 @@ use polars_core::prelude::*;
 #[cfg(feature = "dtype-struct")]
 use polars_core::series::arithmetic::_struct_arithmetic;
 use polars_core::utils::align_chunks_binary;
-use polars_core::with_match_physical_numeric_polars_type;
+use polars_core::{
+    with_match_physical_integer_polars_type, with_match_physical_numeric_polars_type,
+};
+
+use super::remainder::pow2_divisor;
 
 #[inline]
 fn floor_div_element<T: NumericNative>(a: T, b: T) -> T {
@@ -92,6 +96,21 @@ fn floor_div_ca<T: PolarsNumericType>(a: &ChunkedArray<T>, b: &ChunkedArray<T>)
     unsafe { ChunkedArray::from_chunks(a.name(), chunks) }
 }
 
+/// Integer floor division; a power of two divisor is an arithmetic shift.
+fn floor_div_int_ca<T>(a: &ChunkedArray<T>, b: &ChunkedArray<T>) -> ChunkedArray<T>
+where
+    T: PolarsNumericType,
+    T::Native: PrimInt,
+{
+    match pow2_divisor(b) {
+        Some(divisor) => {
+            let shift = divisor.trailing_zeros() as usize;
+            a.apply(|a| a >> shift)
+        }
+        None => floor_div_ca(a, b),
+    }
+}
+
 pub fn floor_div_series(a: &Series, b: &Series) -> PolarsResult<Series> {
     match (a.dtype(), b.dtype()) {
         #[cfg(feature = "dtype-struct")]
@@ -108,12 +127,21 @@ pub fn floor_div_series(a: &Series, b: &Series) -> PolarsResult<Series> {
     let a = a.to_physical_repr();
     let b = b.to_physical_repr();
 
-    let out = with_match_physical_numeric_polars_type!(a.dtype(), |$T| {
-        let a: &ChunkedArray<$T> = a.as_ref().as_ref().as_ref();
-        let b: &ChunkedArray<$T> = b.as_ref().as_ref().as_ref();
+    let out = if a.dtype().is_integer() {
+        with_match_physical_integer_polars_type!(a.dtype(), |$T| {
+            let a: &ChunkedArray<$T> = a.as_ref().as_ref().as_ref();
+            let b: &ChunkedArray<$T> = b.as_ref().as_ref().as_ref();
+
+            floor_div_int_ca(a, b).into_series()
+        })
+    } else {
+        with_match_physical_numeric_polars_type!(a.dtype(), |$T| {
+            let a: &ChunkedArray<$T> = a.as_ref().as_ref().as_ref();
+            let b: &ChunkedArray<$T> = b.as_ref().as_ref().as_ref();
 
-        floor_div_ca(a, b).into_series()
-    });
+            floor_div_ca(a, b).into_series()
+        })
+    };
 
     out.cast(logical_type)
 }
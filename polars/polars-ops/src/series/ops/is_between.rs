@@ -0,0 +1,93 @@
+use arrow::array::{BooleanArray, PrimitiveArray};
+use arrow::bitmap::Bitmap;
+use polars_arrow::array::default_arrays::FromData;
+use polars_arrow::prelude::ArrayRef;
+use polars_core::prelude::*;
+use polars_core::with_match_physical_numeric_polars_type;
+
+fn is_between_arr<T, F>(arr: &PrimitiveArray<T>, in_range: F) -> ArrayRef
+where
+    T: NumericNative,
+    F: Fn(T) -> bool,
+{
+    let values = Bitmap::from_trusted_len_iter(arr.values().iter().map(|&v| in_range(v)));
+    Box::new(BooleanArray::from_data_default(
+        values,
+        arr.validity().cloned(),
+    ))
+}
+
+fn is_between_ca<T: PolarsNumericType>(
+    ca: &ChunkedArray<T>,
+    lower: T::Native,
+    upper: T::Native,
+    lower_inclusive: bool,
+    upper_inclusive: bool,
+) -> BooleanChunked {
+    // every combination of closedness gets its own kernel, so that the
+    // comparisons are resolved at compile time and the bounds stay in registers
+    match (lower_inclusive, upper_inclusive) {
+        (true, true) => {
+            ca.apply_kernel_cast(&|arr| is_between_arr(arr, |v| v >= lower && v <= upper))
+        }
+        (true, false) => {
+            ca.apply_kernel_cast(&|arr| is_between_arr(arr, |v| v >= lower && v < upper))
+        }
+        (false, true) => {
+            ca.apply_kernel_cast(&|arr| is_between_arr(arr, |v| v > lower && v <= upper))
+        }
+        (false, false) => {
+            ca.apply_kernel_cast(&|arr| is_between_arr(arr, |v| v > lower && v < upper))
+        }
+    }
+}
+
+/// Check if the values of `s` lie between `lower` and `upper`.
+///
+/// Numeric data compared against scalar bounds is checked in a single pass,
+/// other inputs fall back to two comparisons combined with `&`.
+pub fn is_between(
+    s: &Series,
+    lower: &Series,
+    upper: &Series,
+    lower_inclusive: bool,
+    upper_inclusive: bool,
+) -> PolarsResult<BooleanChunked> {
+    if s.dtype().is_numeric()
+        && lower.len() == 1
+        && upper.len() == 1
+        && lower.dtype() == s.dtype()
+        && upper.dtype() == s.dtype()
+    {
+        let out = with_match_physical_numeric_polars_type!(s.dtype(), |$T| {
+            let ca: &ChunkedArray<$T> = s.as_ref().as_ref().as_ref();
+            let lower: &ChunkedArray<$T> = lower.as_ref().as_ref().as_ref();
+            let upper: &ChunkedArray<$T> = upper.as_ref().as_ref().as_ref();
+            match (lower.get(0), upper.get(0)) {
+                (Some(lower), Some(upper)) => Some(is_between_ca(
+                    ca,
+                    lower,
+                    upper,
+                    lower_inclusive,
+                    upper_inclusive,
+                )),
+                _ => None,
+            }
+        });
+        if let Some(out) = out {
+            return Ok(out);
+        }
+    }
+
+    let left = if lower_inclusive {
+        ChunkCompare::<&Series>::gt_eq(s, lower)?
+    } else {
+        ChunkCompare::<&Series>::gt(s, lower)?
+    };
+    let right = if upper_inclusive {
+        ChunkCompare::<&Series>::lt_eq(s, upper)?
+    } else {
+        ChunkCompare::<&Series>::lt(s, upper)?
+    };
+    Ok(&left & &right)
+}
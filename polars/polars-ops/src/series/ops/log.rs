@@ -1,9 +1,29 @@
+use polars_core::export::num::ToPrimitive;
 use polars_core::prelude::*;
 
 use crate::series::ops::SeriesSealed;
 
+/// Apply the logarithm to `base` with `$method`, using the dedicated kernels
+/// for the common bases and hoisting `1 / ln(base)` out of the loop otherwise.
+macro_rules! apply_log {
+    ($ca:expr, $method:ident, $T:ty, $base:expr) => {{
+        let base: $T = $base;
+        if base == std::f64::consts::E as $T {
+            $ca.$method(|v: $T| v.ln())
+        } else if base == 2.0 {
+            $ca.$method(|v: $T| v.log2())
+        } else if base == 10.0 {
+            $ca.$method(|v: $T| v.log10())
+        } else {
+            // multiplying is cheaper than dividing in the loop
+            let inv = 1.0 / base.ln();
+            $ca.$method(|v: $T| v.ln() * inv)
+        }
+    }};
+}
+
 fn log<T: PolarsNumericType>(ca: &ChunkedArray<T>, base: f64) -> Float64Chunked {
-    ca.cast_and_apply_in_place(|v: f64| v.log(base))
+    apply_log!(ca, cast_and_apply_in_place, f64, base)
 }
 
 fn log1p<T: PolarsNumericType>(ca: &ChunkedArray<T>) -> Float64Chunked {
@@ -14,6 +34,32 @@ fn exp<T: PolarsNumericType>(ca: &ChunkedArray<T>) -> Float64Chunked {
     ca.cast_and_apply_in_place(|v: f64| v.exp())
 }
 
+/// `-sum(pk * log(pk))` in a single pass over the values, without
+/// materializing the normalized probabilities or their logarithms.
+/// Like the previous implementation, this is `None` when there are no
+/// non-null values.
+fn entropy<T>(ca: &ChunkedArray<T>, base: f64, normalize: bool) -> Option<f64>
+where
+    T: PolarsFloatType,
+{
+    if ca.null_count() == ca.len() {
+        return None;
+    }
+    let sum = if normalize { ca.sum()?.to_f64()? } else { 1.0 };
+    let mut out = 0.0;
+    for arr in ca.downcast_iter() {
+        for v in arr.iter().flatten() {
+            let mut pk = v.to_f64().unwrap();
+            if sum != 1.0 {
+                pk /= sum;
+            }
+            out += pk * pk.ln();
+        }
+    }
+    // log_b(pk) = ln(pk) / ln(b), so the division is done once
+    Some(-out / base.ln())
+}
+
 pub trait LogSeries: SeriesSealed {
     /// Compute the logarithm to a given base
     fn log(&self, base: f64) -> Series {
@@ -26,8 +72,8 @@ pub trait LogSeries: SeriesSealed {
             Int64 => log(s.i64().unwrap(), base).into_series(),
             UInt32 => log(s.u32().unwrap(), base).into_series(),
             UInt64 => log(s.u64().unwrap(), base).into_series(),
-            Float32 => s.f32().unwrap().apply(|v| v.log(base as f32)).into_series(),
-            Float64 => s.f64().unwrap().apply(|v| v.log(base)).into_series(),
+            Float32 => apply_log!(s.f32().unwrap(), apply, f32, base as f32).into_series(),
+            Float64 => apply_log!(s.f64().unwrap(), apply, f64, base).into_series(),
             _ => s.cast(&DataType::Float64).unwrap().log(base),
         }
     }
@@ -71,24 +117,8 @@ pub trait LogSeries: SeriesSealed {
     fn entropy(&self, base: f64, normalize: bool) -> Option<f64> {
         let s = self.as_series().to_physical_repr();
         match s.dtype() {
-            DataType::Float32 | DataType::Float64 => {
-                let pk = s.as_ref();
-
-                let pk = if normalize {
-                    let sum = pk.sum_as_series();
-
-                    if sum.get(0).unwrap().extract::<f64>()? != 1.0 {
-                        pk / &sum
-                    } else {
-                        pk.clone()
-                    }
-                } else {
-                    pk.clone()
-                };
-
-                let log_pk = pk.log(base);
-                (&pk * &log_pk).sum::<f64>().map(|v| -v)
-            }
+            DataType::Float32 => entropy(s.f32().unwrap(), base, normalize),
+            DataType::Float64 => entropy(s.f64().unwrap(), base, normalize),
             _ => s
                 .cast(&DataType::Float64)
                 .ok()
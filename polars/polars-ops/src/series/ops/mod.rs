@@ -6,12 +6,14 @@ mod arg_min_max;
 mod floor_divide;
 #[cfg(feature = "fused")]
 mod fused;
+mod is_between;
 #[cfg(feature = "is_first")]
 mod is_first;
 #[cfg(feature = "is_unique")]
 mod is_unique;
 #[cfg(feature = "log")]
 mod log;
+mod remainder;
 #[cfg(feature = "rolling_window")]
 mod rolling;
 #[cfg(feature = "search_sorted")]
@@ -28,6 +30,7 @@ pub use arg_min_max::ArgAgg;
 pub use floor_divide::*;
 #[cfg(feature = "fused")]
 pub use fused::*;
+pub use is_between::*;
 #[cfg(feature = "is_first")]
 pub use is_first::*;
 #[cfg(feature = "is_unique")]
@@ -35,6 +38,7 @@ pub use is_unique::*;
 #[cfg(feature = "log")]
 pub use log::*;
 use polars_core::prelude::*;
+pub use remainder::*;
 #[cfg(feature = "rolling_window")]
 pub use rolling::*;
 #[cfg(feature = "search_sorted")]
@@ -0,0 +1,81 @@
+use num::PrimInt;
+use polars_core::export::num;
+use polars_core::prelude::*;
+use polars_core::with_match_physical_integer_polars_type;
+
+/// Returns the divisor if `b` is a single, non-null, positive power of two.
+pub(super) fn pow2_divisor<T>(b: &ChunkedArray<T>) -> Option<T::Native>
+where
+    T: PolarsNumericType,
+    T::Native: PrimInt,
+{
+    if b.len() != 1 {
+        return None;
+    }
+    let divisor = b.get(0)?;
+    match divisor.to_u64() {
+        Some(v) if v.is_power_of_two() => Some(divisor),
+        _ => None,
+    }
+}
+
+/// Truncated remainder (same semantics as `%`) by a positive power of two.
+#[inline]
+fn rem_pow2_element<T: PrimInt>(a: T, mask: T) -> T {
+    if T::min_value() < T::zero() {
+        // bias negative values so that the mask truncates towards zero
+        let bits = T::zero().count_zeros() as usize;
+        let bias = (a >> (bits - 1)) & mask;
+        a - ((a + bias) & !mask)
+    } else {
+        a & mask
+    }
+}
+
+fn remainder_ca<T>(a: &ChunkedArray<T>, b: &ChunkedArray<T>) -> ChunkedArray<T>
+where
+    T: PolarsNumericType,
+    T::Native: PrimInt,
+{
+    match pow2_divisor(b) {
+        Some(divisor) => {
+            let mask = divisor - T::Native::one();
+            a.apply(|a| rem_pow2_element(a, mask))
+        }
+        None => a % b,
+    }
+}
+
+/// Compute `a % b`.
+///
+/// If `b` is an integer literal that is a power of two, the remainder is
+/// computed with a bitmask instead of an integer division.
+pub fn remainder_series(a: &Series, b: &Series) -> PolarsResult<Series> {
+    if b.len() == 1 && a.dtype() == b.dtype() && a.dtype().is_integer() {
+        let out = with_match_physical_integer_polars_type!(a.dtype(), |$T| {
+            let a: &ChunkedArray<$T> = a.as_ref().as_ref().as_ref();
+            let b: &ChunkedArray<$T> = b.as_ref().as_ref().as_ref();
+            remainder_ca(a, b).into_series()
+        });
+        return Ok(out);
+    }
+    Ok(a % b)
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn test_rem_pow2_element() {
+        for a in -17i64..17 {
+            for shift in 0..4 {
+                let b = 1i64 << shift;
+                assert_eq!(rem_pow2_element(a, b - 1), a % b);
+            }
+        }
+        for a in 0u8..=255 {
+            assert_eq!(rem_pow2_element(a, 7), a % 8);
+        }
+    }
+}
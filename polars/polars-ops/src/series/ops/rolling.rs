@@ -1,13 +1,41 @@
 use polars_core::prelude::*;
 #[cfg(feature = "moment")]
 use {
-    polars_core::export::num::{self, Float, FromPrimitive},
-    polars_core::utils::with_unstable_series,
-    std::ops::SubAssign,
+    polars_arrow::utils::CustomIterTools,
+    polars_core::export::num::{Float, FromPrimitive},
 };
 
 use crate::series::ops::SeriesSealed;
 
+/// Skewness of the values of a window, computed like [`Series::skew`] but
+/// without allocating intermediate `Series`.
+#[cfg(feature = "moment")]
+fn skew<I>(values: I, bias: bool) -> Option<f64>
+where
+    I: Iterator<Item = f64> + Clone,
+{
+    let (n, sum) = values
+        .clone()
+        .fold((0usize, 0.0), |(n, sum), v| (n + 1, sum + v));
+    if n == 0 {
+        return None;
+    }
+    let n = n as f64;
+    let mean = sum / n;
+    let (m2, m3) = values.fold((0.0, 0.0), |(m2, m3), v| {
+        let d = v - mean;
+        let d2 = d * d;
+        (m2 + d2, m3 + d2 * d)
+    });
+    let out = (m3 / n) / (m2 / n).powf(1.5);
+
+    if bias {
+        Some(out)
+    } else {
+        Some(((n - 1.0) * n).sqrt() / (n - 2.0) * out)
+    }
+}
+
 #[cfg(feature = "moment")]
 fn rolling_skew<T>(
     ca: &ChunkedArray<T>,
@@ -15,22 +43,41 @@ fn rolling_skew<T>(
     bias: bool,
 ) -> PolarsResult<ChunkedArray<T>>
 where
-    ChunkedArray<T>: IntoSeries,
     T: PolarsFloatType,
-    T::Native: Float + IsFloat + SubAssign + num::pow::Pow<T::Native, Output = T::Native>,
+    T::Native: Float,
 {
-    with_unstable_series(ca.dtype(), |us| {
-        ca.rolling_apply_float(window_size, |arr| {
-            let arr = unsafe { arr.chunks_mut().get_mut(0).unwrap() };
-
-            us.with_array(arr, |us| {
-                us.as_ref()
-                    .skew(bias)
-                    .unwrap()
-                    .map(|flt| T::Native::from_f64(flt).unwrap())
-            })
+    let len = ca.len();
+    if window_size > len {
+        return Ok(ChunkedArray::full_null(ca.name(), len));
+    }
+    let ca = ca.rechunk();
+    let arr = ca.downcast_iter().next().unwrap();
+    let values = arr.values().as_slice();
+    let to_f64 = |v: &T::Native| v.to_f64().unwrap();
+
+    // every window is aggregated directly from the values slice, the
+    // moments of the window are computed in two passes over it (like
+    // `Series::skew`), as running power sums lose too much precision
+    let mut out: ChunkedArray<T> = (0..len)
+        .map(|i| {
+            if i + 1 < window_size {
+                return None;
+            }
+            let window = i + 1 - window_size..i + 1;
+            let out = match arr.validity() {
+                None => skew(values[window].iter().map(to_f64), bias),
+                Some(validity) => skew(
+                    window
+                        .filter(|&idx| unsafe { validity.get_bit_unchecked(idx) })
+                        .map(|idx| to_f64(&values[idx])),
+                    bias,
+                ),
+            };
+            out.map(|v| T::Native::from_f64(v).unwrap())
         })
-    })
+        .collect_trusted();
+    out.rename(ca.name());
+    Ok(out)
 }
 
 pub trait RollingSeries: SeriesSealed {
@@ -1,19 +1,84 @@
 #[cfg(feature = "hash")]
 use polars_core::export::ahash;
+use polars_core::export::num::{Bounded, NumCast};
 use polars_core::prelude::*;
 use polars_core::series::IsSorted;
+use polars_core::utils::NoNull;
 
 use crate::series::ops::SeriesSealed;
 
+/// Count the values of an 8 or 16 bit integer array in a table indexed by value,
+/// instead of hashing them into groups. The values are returned in order of
+/// first occurrence, like the groups of `group_tuples(_, true)`.
+fn value_counts_small_int<T>(ca: &ChunkedArray<T>) -> (Series, IdxCa)
+where
+    T: PolarsIntegerType,
+    T::Native: Bounded + NumCast,
+{
+    let min = T::Native::min_value().to_i64().unwrap();
+    let domain = (T::Native::max_value().to_i64().unwrap() - min + 1) as usize;
+    // per value: (index of first occurrence, count)
+    let mut table = vec![(0 as IdxSize, 0 as IdxSize); domain];
+    let mut nulls = (0 as IdxSize, 0 as IdxSize);
+
+    let mut idx = 0 as IdxSize;
+    for arr in ca.downcast_iter() {
+        for opt_v in arr.iter() {
+            let entry = match opt_v {
+                Some(v) => &mut table[(v.to_i64().unwrap() - min) as usize],
+                None => &mut nulls,
+            };
+            if entry.1 == 0 {
+                entry.0 = idx;
+            }
+            entry.1 += 1;
+            idx += 1;
+        }
+    }
+
+    let mut groups = table
+        .into_iter()
+        .enumerate()
+        .filter(|(_, (_, count))| *count > 0)
+        .map(|(i, (first, count))| {
+            let v: T::Native = NumCast::from(i as i64 + min).unwrap();
+            (first, Some(v), count)
+        })
+        .collect::<Vec<_>>();
+    if nulls.1 > 0 {
+        groups.push((nulls.0, None, nulls.1));
+    }
+    groups.sort_unstable_by_key(|(first, _, _)| *first);
+
+    let mut values: ChunkedArray<T> = groups.iter().map(|(_, v, _)| *v).collect();
+    values.rename(ca.name());
+    let mut counts: IdxCa = groups
+        .iter()
+        .map(|(_, _, count)| *count)
+        .collect::<NoNull<IdxCa>>()
+        .into_inner();
+    counts.rename("counts");
+    (values.into_series(), counts)
+}
+
 pub trait SeriesMethods: SeriesSealed {
     /// Create a [`DataFrame`] with the unique `values` of this [`Series`] and a column `"counts"`
     /// with dtype [`IdxType`]
     fn value_counts(&self, multithreaded: bool, sorted: bool) -> PolarsResult<DataFrame> {
         let s = self.as_series();
-        // we need to sort here as well in case of `maintain_order` because duplicates behavior is undefined
-        let groups = s.group_tuples(multithreaded, sorted)?;
-        let values = unsafe { s.agg_first(&groups) };
-        let counts = groups.group_lengths("counts");
+        let (values, counts) = match s.dtype() {
+            DataType::UInt8 => value_counts_small_int(s.u8().unwrap()),
+            DataType::Int8 => value_counts_small_int(s.i8().unwrap()),
+            // the table has 2^16 entries, only worth it if there are enough values
+            DataType::UInt16 if s.len() > 1 << 12 => value_counts_small_int(s.u16().unwrap()),
+            DataType::Int16 if s.len() > 1 << 12 => value_counts_small_int(s.i16().unwrap()),
+            _ => {
+                // we need to sort here as well in case of `maintain_order` because duplicates behavior is undefined
+                let groups = s.group_tuples(multithreaded, sorted)?;
+                let values = unsafe { s.agg_first(&groups) };
+                (values, groups.group_lengths("counts"))
+            }
+        };
         let cols = vec![values, counts.into_series()];
         let df = DataFrame::new_no_checks(cols);
         if sorted {
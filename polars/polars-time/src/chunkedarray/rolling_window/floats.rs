@@ -28,6 +28,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            false,
             &rolling::no_nulls::rolling_mean,
             &rolling::nulls::rolling_mean,
             Some(&super::rolling_kernels::no_nulls::rolling_mean),
@@ -42,6 +43,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            false,
             &rolling::no_nulls::rolling_sum,
             &rolling::nulls::rolling_sum,
             Some(&super::rolling_kernels::no_nulls::rolling_sum),
@@ -56,6 +58,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            true,
             &rolling::no_nulls::rolling_min,
             &rolling::nulls::rolling_min,
             Some(&super::rolling_kernels::no_nulls::rolling_min),
@@ -70,6 +73,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            true,
             &rolling::no_nulls::rolling_max,
             &rolling::nulls::rolling_max,
             Some(&super::rolling_kernels::no_nulls::rolling_max),
@@ -86,6 +90,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            true,
             &rolling::no_nulls::rolling_median,
             &rolling::nulls::rolling_median,
             None,
@@ -137,6 +142,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            false,
             &rolling::no_nulls::rolling_var,
             &rolling::nulls::rolling_var,
             Some(&super::rolling_kernels::no_nulls::rolling_var),
@@ -179,6 +185,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            false,
             &rolling::no_nulls::rolling_std,
             &rolling::nulls::rolling_std,
             Some(&super::rolling_kernels::no_nulls::rolling_std),
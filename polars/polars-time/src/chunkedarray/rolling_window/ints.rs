@@ -22,6 +22,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            true,
             &rolling::no_nulls::rolling_sum,
             &rolling::nulls::rolling_sum,
             Some(&super::rolling_kernels::no_nulls::rolling_sum),
@@ -50,6 +51,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            true,
             &rolling::no_nulls::rolling_min,
             &rolling::nulls::rolling_min,
             Some(&super::rolling_kernels::no_nulls::rolling_min),
@@ -63,6 +65,7 @@ where
         rolling_agg(
             &self.0,
             options,
+            true,
             &rolling::no_nulls::rolling_max,
             &rolling::nulls::rolling_max,
             Some(&super::rolling_kernels::no_nulls::rolling_max),
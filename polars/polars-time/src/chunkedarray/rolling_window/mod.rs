@@ -16,7 +16,13 @@ use polars_arrow::export::arrow;
 use polars_arrow::kernels::rolling;
 #[cfg(feature = "rolling_window")]
 use polars_arrow::prelude::QuantileInterpolOptions;
+#[cfg(feature = "rolling_window")]
+use polars_core::export::rayon::prelude::*;
 use polars_core::prelude::*;
+#[cfg(feature = "rolling_window")]
+use polars_core::utils::_split_offsets;
+#[cfg(feature = "rolling_window")]
+use polars_core::POOL;
 
 #[cfg(feature = "rolling_window")]
 use crate::prelude::*;
@@ -214,12 +220,59 @@ fn check_input(window_size: usize, min_periods: usize) -> PolarsResult<()> {
     Ok(())
 }
 
+/// Whether a fixed window rolling aggregation is split over the thread pool.
+///
+/// The partitions should be large compared to the window, as every partition
+/// recomputes the windows that overlap with its neighbours.
+#[cfg(feature = "rolling_window")]
+fn use_parallel_rolling(len: usize, window_size: usize) -> bool {
+    let n_threads = POOL.current_num_threads();
+    n_threads > 1 && len >= 1 << 16 && len / n_threads >= 64 * window_size
+}
+
+/// Apply a fixed window rolling kernel on partitions of `values` in parallel.
+///
+/// Every partition also reads the `window_size` values before and after it, so the
+/// windows at the partition boundaries are complete. The output of these
+/// overlapping values is sliced off again.
+#[cfg(feature = "rolling_window")]
+#[allow(clippy::type_complexity)]
+fn rolling_agg_fixed_par<T: PolarsNumericType>(
+    values: &[T::Native],
+    options: &RollingOptionsFixedWindow,
+    rolling_agg_fn: &(dyn Fn(&[T::Native], usize, usize, bool, Option<&[f64]>) -> ArrayRef + Sync),
+) -> Vec<ArrayRef> {
+    let len = values.len();
+    let window_size = options.window_size;
+    POOL.install(|| {
+        _split_offsets(len, POOL.current_num_threads())
+            .into_par_iter()
+            .map(|(offset, part_len)| {
+                let start = offset.saturating_sub(window_size);
+                let end = std::cmp::min(offset + part_len + window_size, len);
+                let out = rolling_agg_fn(
+                    &values[start..end],
+                    window_size,
+                    options.min_periods,
+                    options.center,
+                    options.weights.as_deref(),
+                );
+                out.sliced(offset - start, part_len)
+            })
+            .collect()
+    })
+}
+
 #[cfg(feature = "rolling_window")]
 #[allow(clippy::type_complexity)]
 fn rolling_agg<T>(
     ca: &ChunkedArray<T>,
     options: RollingOptionsImpl,
-    rolling_agg_fn: &dyn Fn(&[T::Native], usize, usize, bool, Option<&[f64]>) -> ArrayRef,
+    // whether the kernel may run on partitions of the input; only for kernels whose
+    // output doesn't depend on where they start, as the partitions depend on the
+    // number of threads
+    allow_parallel: bool,
+    rolling_agg_fn: &(dyn Fn(&[T::Native], usize, usize, bool, Option<&[f64]>) -> ArrayRef + Sync),
     rolling_agg_fn_nulls: &dyn Fn(
         &PrimitiveArray<T::Native>,
         usize,
@@ -254,6 +307,11 @@ where
         check_input(options.window_size, options.min_periods)?;
 
         Ok(match ca.null_count() {
+            0 if allow_parallel && use_parallel_rolling(arr.len(), options.window_size) => {
+                let chunks =
+                    rolling_agg_fixed_par::<T>(arr.values().as_slice(), &options, rolling_agg_fn);
+                return Series::try_from((ca.name(), chunks));
+            }
             0 => rolling_agg_fn(
                 arr.values().as_slice(),
                 options.window_size,
@@ -288,3 +346,49 @@ where
     }?;
     Series::try_from((ca.name(), arr))
 }
+
+#[cfg(all(test, feature = "rolling_window"))]
+mod test {
+    use super::*;
+
+    #[test]
+    fn test_rolling_float_large_input_matches_sequential_kernel() -> PolarsResult<()> {
+        // large enough for the parallel path, with sums that have to be rounded
+        let values = (0..200_000u64)
+            .map(|i| 1e8 + ((i * 7919) % 1000) as f64 * 0.1)
+            .collect::<Vec<_>>();
+        let ca = Float64Chunked::from_vec("a", values.clone());
+        let options = RollingOptionsImpl {
+            window_size: Duration::parse("5i"),
+            min_periods: 5,
+            ..Default::default()
+        };
+        let wrapped = WrapFloat(ca);
+
+        let cases: [(Series, ArrayRef); 4] = [
+            (
+                wrapped.rolling_sum(options.clone())?,
+                rolling::no_nulls::rolling_sum(&values, 5, 5, false, None),
+            ),
+            (
+                wrapped.rolling_mean(options.clone())?,
+                rolling::no_nulls::rolling_mean(&values, 5, 5, false, None),
+            ),
+            (
+                wrapped.rolling_var(options.clone())?,
+                rolling::no_nulls::rolling_var(&values, 5, 5, false, None),
+            ),
+            (
+                wrapped.rolling_min(options.clone())?,
+                rolling::no_nulls::rolling_min(&values, 5, 5, false, None),
+            ),
+        ];
+        for (out, expected) in cases {
+            let expected = Series::try_from(("a", expected))?;
+            let out = out.f64()?.into_iter().map(|v| v.map(f64::to_bits));
+            let expected = expected.f64()?.into_iter().map(|v| v.map(f64::to_bits));
+            assert!(out.eq(expected));
+        }
+        Ok(())
+    }
+}
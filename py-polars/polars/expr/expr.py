@@ -6,7 +6,7 @@ import operator
 import os
 import random
 from datetime import timedelta
-from functools import partial, reduce
+from functools import lru_cache, partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -43,10 +43,11 @@ from polars.expr.meta import ExprMetaNameSpace
 from polars.expr.string import ExprStringNameSpace
 from polars.expr.struct import ExprStructNameSpace
 from polars.utils._parse_expr_input import (
+    _cached_lit,
+    _literal_cache_key,
     parse_as_expression,
     parse_as_list_of_expressions,
 )
-from polars.utils.convert import _timedelta_to_pl_duration
 from polars.utils.decorators import deprecated_alias
 from polars.utils.meta import threadpool_size
 from polars.utils.various import sphinx_accessor
@@ -3687,7 +3688,7 @@ class Expr:
         └───────┘
 
         """
-        return reduce(operator.and_, (self,) + others)
+        return _reduce_balanced(operator.and_, (self, *others))
 
     def or_(self, *others: Any) -> Self:
         """
@@ -3730,7 +3731,7 @@ class Expr:
         └───────┘
 
         """
-        return reduce(operator.or_, (self,) + others)
+        return _reduce_balanced(operator.or_, (self, *others))
 
     def eq(self, other: Any) -> Self:
         """
@@ -4309,8 +4310,17 @@ class Expr:
         └──────────┘
 
         """
-        if isinstance(other, Collection) and not isinstance(other, str):
-            if isinstance(other, (Set, FrozenSet)):
+        # dispatch on the concrete type first; the `Collection` ABC check is slow
+        other_type = type(other)
+        if other_type is pl.Expr or other_type is str:
+            other = parse_as_expression(other)
+        elif other_type is tuple and other:
+            key = _literal_cache_key(other)
+            other = F.lit(pl.Series(other)) if key is None else _cached_lit(key, other)
+        elif other_type is list or other_type is tuple or (
+            isinstance(other, Collection) and not isinstance(other, str)
+        ):
+            if other_type is not list and isinstance(other, (Set, FrozenSet)):
                 other = sorted(other)
             other = F.lit(None) if len(other) == 0 else F.lit(pl.Series(other))
         else:
@@ -4730,9 +4740,6 @@ class Expr:
         └──────┘
 
         """
-        window_size, min_periods = _prepare_rolling_window_args(
-            window_size, min_periods
-        )
         return self._from_pyexpr(
             self._pyexpr.rolling_min(
                 window_size, weights, min_periods, center, by, closed
@@ -4830,9 +4837,6 @@ class Expr:
         └──────┘
 
         """
-        window_size, min_periods = _prepare_rolling_window_args(
-            window_size, min_periods
-        )
         return self._from_pyexpr(
             self._pyexpr.rolling_max(
                 window_size, weights, min_periods, center, by, closed
@@ -4907,6 +4911,10 @@ class Expr:
         window, consider using `groupby_rolling` this method can cache the window size
         computation.
 
+        To apply the same rolling mean to many columns, select them in a single
+        expression (e.g. ``pl.all().rolling_mean(2)``); the columns are then processed
+        in parallel.
+
         Examples
         --------
         >>> df = pl.DataFrame({"A": [1.0, 8.0, 6.0, 2.0, 16.0, 10.0]})
@@ -4929,10 +4937,20 @@ class Expr:
         │ 13.0 │
         └──────┘
 
+        >>> df = pl.DataFrame({"A": [1.0, 8.0, 6.0], "B": [2.0, 4.0, 0.0]})
+        >>> df.select(pl.all().rolling_mean(window_size=2))
+        shape: (3, 2)
+        ┌──────┬──────┐
+        │ A    ┆ B    │
+        │ ---  ┆ ---  │
+        │ f64  ┆ f64  │
+        ╞══════╪══════╡
+        │ null ┆ null │
+        │ 4.5  ┆ 3.0  │
+        │ 7.0  ┆ 2.0  │
+        └──────┴──────┘
+
         """
-        window_size, min_periods = _prepare_rolling_window_args(
-            window_size, min_periods
-        )
         return self._from_pyexpr(
             self._pyexpr.rolling_mean(
                 window_size, weights, min_periods, center, by, closed
@@ -5030,9 +5048,6 @@ class Expr:
         └──────┘
 
         """
-        window_size, min_periods = _prepare_rolling_window_args(
-            window_size, min_periods
-        )
         return self._from_pyexpr(
             self._pyexpr.rolling_sum(
                 window_size, weights, min_periods, center, by, closed
@@ -5130,9 +5145,6 @@ class Expr:
         └──────────┘
 
         """
-        window_size, min_periods = _prepare_rolling_window_args(
-            window_size, min_periods
-        )
         return self._from_pyexpr(
             self._pyexpr.rolling_std(
                 window_size, weights, min_periods, center, by, closed
@@ -5230,9 +5242,6 @@ class Expr:
         └──────────┘
 
         """
-        window_size, min_periods = _prepare_rolling_window_args(
-            window_size, min_periods
-        )
         return self._from_pyexpr(
             self._pyexpr.rolling_var(
                 window_size, weights, min_periods, center, by, closed
@@ -5326,9 +5335,6 @@ class Expr:
         └──────┘
 
         """
-        window_size, min_periods = _prepare_rolling_window_args(
-            window_size, min_periods
-        )
         return self._from_pyexpr(
             self._pyexpr.rolling_median(
                 window_size, weights, min_periods, center, by, closed
@@ -5428,9 +5434,6 @@ class Expr:
         └──────┘
 
         """
-        window_size, min_periods = _prepare_rolling_window_args(
-            window_size, min_periods
-        )
         return self._from_pyexpr(
             self._pyexpr.rolling_quantile(
                 quantile,
@@ -7312,7 +7315,7 @@ class Expr:
                 # values = remapping.values()
                 if s.null_count() == 0:  # noqa: SIM114
                     pass
-                elif s.len() - s.null_count() == len(list(filter(None, values))):
+                elif s.len() - s.null_count() == sum(v is not None for v in values):
                     pass
                 else:
                     raise ValueError(
@@ -7321,30 +7324,23 @@ class Expr:
 
             return s
 
-        # Use two functions to save unneeded work.
-        # This factors out allocations and branches.
-        def inner_with_default(s: Series) -> Series:
-            # Convert Series to:
-            #   - multicolumn DataFrame, if Series is a Struct.
-            #   - one column DataFrame in other cases.
-            df = s.to_frame().unnest(s.name) if s.dtype == Struct else s.to_frame()
+        # The remapping Series only depend on the column name and dtypes, so they
+        # are built once and reused for every batch the function is applied to.
+        remap_cache: dict[
+            tuple[str, PolarsDataType, PolarsDataType | None], tuple[Series, Series]
+        ] = {}
+
+        def _remap_series(
+            column: str,
+            input_dtype: PolarsDataType,
+            output_dtype: PolarsDataType | None,
+        ) -> tuple[Series, Series]:
+            cache_key = (column, input_dtype, output_dtype)
+            if cache_key in remap_cache:
+                return remap_cache[cache_key]
 
-            # For struct we always apply mapping to the first column.
-            column = df.columns[0]
-            input_dtype = df.dtypes[0]
             remap_key_column = f"__POLARS_REMAP_KEY_{column}"
             remap_value_column = f"__POLARS_REMAP_VALUE_{column}"
-            is_remapped_column = f"__POLARS_REMAP_IS_REMAPPED_{column}"
-
-            # Set output dtype:
-            #  - to dtype, if specified.
-            #  - to same dtype as expression specified as default value.
-            #  - to None, if dtype was not specified and default was not an expression.
-            return_dtype_ = (
-                df.lazy().select(default).dtypes[0]
-                if return_dtype is None and isinstance(default, Expr)
-                else return_dtype
-            )
 
             remap_key_s = _remap_key_or_value_series(
                 name=remap_key_column,
@@ -7355,12 +7351,12 @@ class Expr:
                 is_keys=True,
             )
 
-            if return_dtype_:
+            if output_dtype:
                 # Create remap value Series with specified output dtype.
                 remap_value_s = pl.Series(
                     remap_value_column,
                     remapping.values(),
-                    dtype=return_dtype_,
+                    dtype=output_dtype,
                     dtype_if_empty=input_dtype,
                 )
             else:
@@ -7376,28 +7372,68 @@ class Expr:
                     is_keys=False,
                 )
 
+            # Categorical keys depend on the string cache that is active when they
+            # are created, so those are not reused.
+            if input_dtype != Categorical:
+                remap_cache[cache_key] = (remap_key_s, remap_value_s)
+            return remap_key_s, remap_value_s
+
+        # Parse the default value once, instead of in every call of `otherwise`.
+        if default is not None:
+            default_parsed = parse_as_expression(default, str_as_lit=True)
+
+        # Use two functions to save unneeded work.
+        # This factors out allocations and branches.
+        def inner_with_default(s: Series) -> Series:
+            # Convert Series to:
+            #   - multicolumn DataFrame, if Series is a Struct.
+            #   - one column DataFrame in other cases.
+            df = s.to_frame().unnest(s.name) if s.dtype == Struct else s.to_frame()
+
+            # For struct we always apply mapping to the first column.
+            column = df.columns[0]
+            input_dtype = df.dtypes[0]
+            remap_key_column = f"__POLARS_REMAP_KEY_{column}"
+            remap_value_column = f"__POLARS_REMAP_VALUE_{column}"
+            is_remapped_column = f"__POLARS_REMAP_IS_REMAPPED_{column}"
+
+            # Set output dtype:
+            #  - to dtype, if specified.
+            #  - to same dtype as expression specified as default value.
+            #  - to None, if dtype was not specified and default was not an expression.
+            return_dtype_ = (
+                df.lazy().select(default).dtypes[0]
+                if return_dtype is None and isinstance(default, Expr)
+                else return_dtype
+            )
+
+            remap_key_s, remap_value_s = _remap_series(
+                column, input_dtype, return_dtype_
+            )
+
+            remap_df = pl.DataFrame([remap_key_s, remap_value_s]).lazy()
+            if remap_value_s.null_count() == 0:
+                # Only rows without a match are null after the join, so those can be
+                # filled directly without a marker column.
+                remapped = F.col(remap_value_column).fill_null(default_parsed)
+            else:
+                remap_df = remap_df.with_columns(F.lit(True).alias(is_remapped_column))
+                remapped = (
+                    F.when(F.col(is_remapped_column).is_not_null())
+                    .then(F.col(remap_value_column))
+                    .otherwise(default_parsed)
+                )
+
             return (
                 (
                     df.lazy()
                     .join(
-                        pl.DataFrame(
-                            [
-                                remap_key_s,
-                                remap_value_s,
-                            ]
-                        )
-                        .lazy()
-                        .with_columns(F.lit(True).alias(is_remapped_column)),
+                        remap_df,
                         how="left",
                         left_on=column,
                         right_on=remap_key_column,
                     )
-                    .select(
-                        F.when(F.col(is_remapped_column).is_not_null())
-                        .then(F.col(remap_value_column))
-                        .otherwise(default)
-                        .alias(column)
-                    )
+                    .select(remapped.alias(column))
                 )
                 .collect(no_optimization=True)
                 .to_series()
@@ -7407,52 +7443,21 @@ class Expr:
             column = s.name
             input_dtype = s.dtype
             remap_key_column = f"__POLARS_REMAP_KEY_{column}"
-            remap_value_column = f"__POLARS_REMAP_VALUE_{column}"
-            is_remapped_column = f"__POLARS_REMAP_IS_REMAPPED_{column}"
 
-            remap_key_s = _remap_key_or_value_series(
-                name=remap_key_column,
-                values=list(remapping.keys()),
-                dtype=input_dtype,
-                dtype_if_empty=input_dtype,
-                dtype_keys=input_dtype,
-                is_keys=True,
+            remap_key_s, remap_value_s = _remap_series(
+                column, input_dtype, return_dtype
             )
 
-            if return_dtype:
-                # Create remap value Series with specified output dtype.
-                remap_value_s = pl.Series(
-                    remap_value_column,
-                    remapping.values(),
-                    dtype=return_dtype,
-                    dtype_if_empty=input_dtype,
-                )
-            else:
-                # Create remap value Series with same output dtype as remap key Series,
-                # if possible (if both are integers, both are floats or remap value
-                # Series is pl.Utf8 and remap key Series is pl.Categorical).
-                remap_value_s = _remap_key_or_value_series(
-                    name=remap_value_column,
-                    values=remapping.values(),
-                    dtype=None,
-                    dtype_if_empty=input_dtype,
-                    dtype_keys=input_dtype,
-                    is_keys=False,
-                )
+            if not remapping:
+                # Nothing can be remapped, so every value is mapped to null.
+                return remap_value_s.alias(column).extend_constant(None, s.len())
 
             return (
                 (
                     s.to_frame()
                     .lazy()
                     .join(
-                        pl.DataFrame(
-                            [
-                                remap_key_s,
-                                remap_value_s,
-                            ]
-                        )
-                        .lazy()
-                        .with_columns(F.lit(True).alias(is_remapped_column)),
+                        pl.DataFrame([remap_key_s, remap_value_s]).lazy(),
                         how="left",
                         left_on=column,
                         right_on=remap_key_column,
@@ -7598,6 +7603,23 @@ class Expr:
         return ExprStructNameSpace(self)
 
 
+def _reduce_balanced(function: Callable[[Any, Any], Any], operands: Sequence[Any]) -> Any:
+    """
+    Reduce operands of an associative operator as a balanced tree.
+
+    This builds a tree of depth O(log n) instead of the left-deep chain of depth n
+    that a left-to-right reduction produces.
+    """
+    if len(operands) == 1:
+        return operands[0]
+    mid = len(operands) // 2
+    return function(
+        _reduce_balanced(function, operands[:mid]),
+        _reduce_balanced(function, operands[mid:]),
+    )
+
+
+@lru_cache(256)
 def _prepare_alpha(
     com: float | int | None = None,
     span: float | int | None = None,
@@ -7631,21 +7653,3 @@ def _prepare_alpha(
         raise ValueError(f"Require 0 < 'alpha' <= 1 (found {alpha})")
 
     return alpha
-
-
-def _prepare_rolling_window_args(
-    window_size: int | timedelta | str,
-    min_periods: int | None = None,
-) -> tuple[str, int]:
-    if isinstance(window_size, int):
-        if window_size < 1:
-            raise ValueError("'window_size' should be positive")
-
-        if min_periods is None:
-            min_periods = window_size
-        window_size = f"{window_size}i"
-    elif isinstance(window_size, timedelta):
-        window_size = _timedelta_to_pl_duration(window_size)
-    if min_periods is None:
-        min_periods = 1
-    return window_size, min_periods
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Callable, Iterable
 
 from polars import functions as F
@@ -7,11 +8,19 @@ from polars.utils._parse_expr_input import parse_as_list_of_expressions
 from polars.utils._wrap import wrap_ldf
 
 if TYPE_CHECKING:
-    from polars import DataFrame, LazyFrame
+    from polars import DataFrame, Expr, LazyFrame
     from polars.polars import PyLazyGroupBy
     from polars.type_aliases import IntoExpr, RollingInterpolationMethod, SchemaDict
 
 
+@functools.lru_cache(16)
+def _all_agg(method: str | None = None) -> Expr:
+    # expressions are immutable, so the aggregations of the convenience methods
+    # can be shared instead of re-created on every call
+    expr = F.all()
+    return expr if method is None else getattr(expr, method)()
+
+
 class LazyGroupBy:
     """
     Utility class for performing a groupby operation over a lazy dataframe.
@@ -127,6 +136,10 @@ class LazyGroupBy:
 
         return wrap_ldf(self.lgb.agg(exprs))
 
+    def _agg_expr(self, expr: Expr) -> LazyFrame:
+        # the convenience methods pass a single, already parsed expression
+        return wrap_ldf(self.lgb.agg([expr._pyexpr]))
+
     def apply(
         self,
         function: Callable[[DataFrame], DataFrame],
@@ -330,7 +343,7 @@ class LazyGroupBy:
         └─────┴───────────┘
 
         """
-        return self.agg(F.all())
+        return self._agg_expr(_all_agg())
 
     def count(self) -> LazyFrame:
         """
@@ -362,7 +375,7 @@ class LazyGroupBy:
         └────────┴───────┘
 
         """
-        return self.agg(F.count())
+        return self._agg_expr(F.count())
 
     def first(self) -> LazyFrame:
         """
@@ -391,7 +404,7 @@ class LazyGroupBy:
         └────────┴─────┴──────┴───────┘
 
         """
-        return self.agg(F.all().first())
+        return self._agg_expr(_all_agg("first"))
 
     def last(self) -> LazyFrame:
         """
@@ -420,7 +433,7 @@ class LazyGroupBy:
         └────────┴─────┴──────┴───────┘
 
         """
-        return self.agg(F.all().last())
+        return self._agg_expr(_all_agg("last"))
 
     def max(self) -> LazyFrame:
         """
@@ -449,7 +462,7 @@ class LazyGroupBy:
         └────────┴─────┴──────┴──────┘
 
         """
-        return self.agg(F.all().max())
+        return self._agg_expr(_all_agg("max"))
 
     def mean(self) -> LazyFrame:
         """
@@ -478,7 +491,7 @@ class LazyGroupBy:
         └────────┴─────┴──────────┴──────────┘
 
         """
-        return self.agg(F.all().mean())
+        return self._agg_expr(_all_agg("mean"))
 
     def median(self) -> LazyFrame:
         """
@@ -505,7 +518,7 @@ class LazyGroupBy:
         └────────┴─────┴──────┘
 
         """
-        return self.agg(F.all().median())
+        return self._agg_expr(_all_agg("median"))
 
     def min(self) -> LazyFrame:
         """
@@ -534,7 +547,7 @@ class LazyGroupBy:
         └────────┴─────┴──────┴───────┘
 
         """
-        return self.agg(F.all().min())
+        return self._agg_expr(_all_agg("min"))
 
     def n_unique(self) -> LazyFrame:
         """
@@ -561,7 +574,7 @@ class LazyGroupBy:
         └────────┴─────┴─────┘
 
         """
-        return self.agg(F.all().n_unique())
+        return self._agg_expr(_all_agg("n_unique"))
 
     def quantile(
         self, quantile: float, interpolation: RollingInterpolationMethod = "nearest"
@@ -598,7 +611,7 @@ class LazyGroupBy:
         └────────┴─────┴──────┘
 
         """
-        return self.agg(F.all().quantile(quantile, interpolation=interpolation))
+        return self._agg_expr(F.all().quantile(quantile, interpolation=interpolation))
 
     def sum(self) -> LazyFrame:
         """
@@ -627,4 +640,4 @@ class LazyGroupBy:
         └────────┴─────┴──────┴─────┘
 
         """
-        return self.agg(F.all().sum())
+        return self._agg_expr(_all_agg("sum"))
@@ -10,6 +10,7 @@ from polars.utils.convert import (
     _datetime_for_anyvalue,
     _datetime_for_anyvalue_windows,
     _time_to_pl_time,
+    _timedelta_to_pl_duration,
     _timedelta_to_pl_timedelta,
     _to_python_date,
     _to_python_datetime,
@@ -33,6 +34,7 @@ __all__ = [
     "_date_to_pl_date",
     "_deserialize_and_execute",
     "_time_to_pl_time",
+    "_timedelta_to_pl_duration",
     "_timedelta_to_pl_timedelta",
     "_to_python_date",
     "_to_python_datetime",
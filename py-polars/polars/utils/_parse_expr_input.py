@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 from datetime import date, datetime, time, timedelta
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Any, Hashable, Iterable
 
 import polars._reexport as pl
 from polars import functions as F
@@ -100,7 +101,8 @@ def parse_as_expression(
         isinstance(input, (int, float, str, pl.Series, datetime, date, time, timedelta))
         or input is None
     ):
-        expr = F.lit(input)
+        key = _literal_cache_key(input)
+        expr = F.lit(input) if key is None else _cached_lit(key, input)
         structify = False
     elif isinstance(input, list):
         expr = F.lit(pl.Series("", [input]))
@@ -119,6 +121,36 @@ def parse_as_expression(
     return expr
 
 
+_MAX_CACHED_TUPLE_LEN = 64
+
+
+def _literal_cache_key(value: Any) -> Hashable | None:
+    """
+    Return a key uniquely identifying a literal value, or None if it is not cacheable.
+
+    The type is part of the key, as ``1``, ``1.0`` and ``True`` compare equal but
+    result in different literals. Floats are keyed on their repr to tell ``0.0`` and
+    ``-0.0`` apart (and to let ``NaN`` hit the cache). Long tuples are not cached,
+    as the cache would keep them (and the Series built from them) alive.
+    """
+    value_type = type(value)
+    if value_type is float:
+        return (float, repr(value))
+    elif value_type in (int, bool, str) or value is None:
+        return (value_type, value)
+    elif value_type is tuple and len(value) <= _MAX_CACHED_TUPLE_LEN:
+        keys = tuple(_literal_cache_key(v) for v in value)
+        return None if None in keys else (tuple, keys)
+    return None
+
+
+@functools.lru_cache(1024)
+def _cached_lit(key: Hashable, value: Any) -> Expr:
+    # expressions are immutable, so literal leaves can be shared between
+    # expressions; this saves re-creating them when building plans in a loop
+    return F.lit(value)
+
+
 def _structify_expression(expr: Expr) -> Expr:
     unaliased_expr = expr.meta.undo_aliases()
     if unaliased_expr.meta.has_multiple_outputs():
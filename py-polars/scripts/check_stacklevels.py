@@ -31,15 +31,16 @@ class StackLevelChecker(NodeVisitor):
 
 
 if __name__ == "__main__":
+    # `-z` separates the paths by NUL, so paths with whitespace are kept intact
     files = subprocess.run(
-        ["git", "ls-files", "polars"], capture_output=True, text=True
-    ).stdout.split()
+        ["git", "ls-files", "-z", "polars"], capture_output=True, text=True
+    ).stdout.split("\0")
     ret = 0
     for file in files:
-        if file in EXCLUDE:
-            continue
         if not file.endswith(".py"):
             continue
+        if file in EXCLUDE:
+            continue
         with open(file) as fd:
             content = fd.read()
         tree = ast.parse(content)
@@ -4,14 +4,16 @@ use polars::series::ops::NullBehavior;
 use polars_core::prelude::QuantileInterpolOptions;
 use polars_core::series::IsSorted;
 use pyo3::class::basic::CompareOp;
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::{PyBytes, PyFloat};
 
 use crate::apply::lazy::{call_lambda_with_series, map_single};
 use crate::conversion::{parse_fill_null_strategy, Wrap};
+use crate::py_modules::UTILS;
 use crate::series::PySeries;
 use crate::utils::reinterpret;
-use crate::PyExpr;
+use crate::{PyExpr, PyPolarsErr};
 
 #[pymethods]
 impl PyExpr {
@@ -560,117 +562,124 @@ impl PyExpr {
         // do the import outside of the function.
         let pypolars = PyModule::import(py, "polars").unwrap().to_object(py);
 
-        let function = move |s: &Series| {
-            Python::with_gil(|py| {
-                let out = call_lambda_with_series(py, s.clone(), &lambda, &pypolars)
-                    .expect("python function failed");
-                match out.getattr(py, "_s") {
-                    Ok(pyseries) => {
-                        let pyseries = pyseries.extract::<PySeries>(py).unwrap();
-                        pyseries.series
-                    }
-                    Err(_) => {
-                        let obj = out;
-                        let is_float = obj.as_ref(py).is_instance_of::<PyFloat>().unwrap();
-
-                        let dtype = s.dtype();
-
-                        use DataType::*;
-                        let result = match dtype {
-                            UInt8 => {
-                                if is_float {
-                                    let v = obj.extract::<f64>(py).unwrap();
-                                    Ok(UInt8Chunked::from_slice("", &[v as u8]).into_series())
-                                } else {
-                                    obj.extract::<u8>(py)
-                                        .map(|v| UInt8Chunked::from_slice("", &[v]).into_series())
-                                }
-                            }
-                            UInt16 => {
-                                if is_float {
-                                    let v = obj.extract::<f64>(py).unwrap();
-                                    Ok(UInt16Chunked::from_slice("", &[v as u16]).into_series())
-                                } else {
-                                    obj.extract::<u16>(py)
-                                        .map(|v| UInt16Chunked::from_slice("", &[v]).into_series())
-                                }
+        let function = move |py: Python, s: &Series| {
+            let out = call_lambda_with_series(py, s.clone(), &lambda, &pypolars)
+                .expect("python function failed");
+            match out.getattr(py, "_s") {
+                Ok(pyseries) => {
+                    let pyseries = pyseries.extract::<PySeries>(py).unwrap();
+                    pyseries.series
+                }
+                Err(_) => {
+                    let obj = out;
+                    let is_float = obj.as_ref(py).is_instance_of::<PyFloat>().unwrap();
+
+                    let dtype = s.dtype();
+
+                    use DataType::*;
+                    let result = match dtype {
+                        UInt8 => {
+                            if is_float {
+                                let v = obj.extract::<f64>(py).unwrap();
+                                Ok(UInt8Chunked::from_slice("", &[v as u8]).into_series())
+                            } else {
+                                obj.extract::<u8>(py)
+                                    .map(|v| UInt8Chunked::from_slice("", &[v]).into_series())
                             }
-                            UInt32 => {
-                                if is_float {
-                                    let v = obj.extract::<f64>(py).unwrap();
-                                    Ok(UInt32Chunked::from_slice("", &[v as u32]).into_series())
-                                } else {
-                                    obj.extract::<u32>(py)
-                                        .map(|v| UInt32Chunked::from_slice("", &[v]).into_series())
-                                }
+                        }
+                        UInt16 => {
+                            if is_float {
+                                let v = obj.extract::<f64>(py).unwrap();
+                                Ok(UInt16Chunked::from_slice("", &[v as u16]).into_series())
+                            } else {
+                                obj.extract::<u16>(py)
+                                    .map(|v| UInt16Chunked::from_slice("", &[v]).into_series())
                             }
-                            UInt64 => {
-                                if is_float {
-                                    let v = obj.extract::<f64>(py).unwrap();
-                                    Ok(UInt64Chunked::from_slice("", &[v as u64]).into_series())
-                                } else {
-                                    obj.extract::<u64>(py)
-                                        .map(|v| UInt64Chunked::from_slice("", &[v]).into_series())
-                                }
+                        }
+                        UInt32 => {
+                            if is_float {
+                                let v = obj.extract::<f64>(py).unwrap();
+                                Ok(UInt32Chunked::from_slice("", &[v as u32]).into_series())
+                            } else {
+                                obj.extract::<u32>(py)
+                                    .map(|v| UInt32Chunked::from_slice("", &[v]).into_series())
                             }
-                            Int8 => {
-                                if is_float {
-                                    let v = obj.extract::<f64>(py).unwrap();
-                                    Ok(Int8Chunked::from_slice("", &[v as i8]).into_series())
-                                } else {
-                                    obj.extract::<i8>(py)
-                                        .map(|v| Int8Chunked::from_slice("", &[v]).into_series())
-                                }
+                        }
+                        UInt64 => {
+                            if is_float {
+                                let v = obj.extract::<f64>(py).unwrap();
+                                Ok(UInt64Chunked::from_slice("", &[v as u64]).into_series())
+                            } else {
+                                obj.extract::<u64>(py)
+                                    .map(|v| UInt64Chunked::from_slice("", &[v]).into_series())
                             }
-                            Int16 => {
-                                if is_float {
-                                    let v = obj.extract::<f64>(py).unwrap();
-                                    Ok(Int16Chunked::from_slice("", &[v as i16]).into_series())
-                                } else {
-                                    obj.extract::<i16>(py)
-                                        .map(|v| Int16Chunked::from_slice("", &[v]).into_series())
-                                }
+                        }
+                        Int8 => {
+                            if is_float {
+                                let v = obj.extract::<f64>(py).unwrap();
+                                Ok(Int8Chunked::from_slice("", &[v as i8]).into_series())
+                            } else {
+                                obj.extract::<i8>(py)
+                                    .map(|v| Int8Chunked::from_slice("", &[v]).into_series())
                             }
-                            Int32 => {
-                                if is_float {
-                                    let v = obj.extract::<f64>(py).unwrap();
-                                    Ok(Int32Chunked::from_slice("", &[v as i32]).into_series())
-                                } else {
-                                    obj.extract::<i32>(py)
-                                        .map(|v| Int32Chunked::from_slice("", &[v]).into_series())
-                                }
+                        }
+                        Int16 => {
+                            if is_float {
+                                let v = obj.extract::<f64>(py).unwrap();
+                                Ok(Int16Chunked::from_slice("", &[v as i16]).into_series())
+                            } else {
+                                obj.extract::<i16>(py)
+                                    .map(|v| Int16Chunked::from_slice("", &[v]).into_series())
                             }
-                            Int64 => {
-                                if is_float {
-                                    let v = obj.extract::<f64>(py).unwrap();
-                                    Ok(Int64Chunked::from_slice("", &[v as i64]).into_series())
-                                } else {
-                                    obj.extract::<i64>(py)
-                                        .map(|v| Int64Chunked::from_slice("", &[v]).into_series())
-                                }
+                        }
+                        Int32 => {
+                            if is_float {
+                                let v = obj.extract::<f64>(py).unwrap();
+                                Ok(Int32Chunked::from_slice("", &[v as i32]).into_series())
+                            } else {
+                                obj.extract::<i32>(py)
+                                    .map(|v| Int32Chunked::from_slice("", &[v]).into_series())
                             }
-                            Float32 => obj
-                                .extract::<f32>(py)
-                                .map(|v| Float32Chunked::from_slice("", &[v]).into_series()),
-                            Float64 => obj
-                                .extract::<f64>(py)
-                                .map(|v| Float64Chunked::from_slice("", &[v]).into_series()),
-                            dt => panic!("{dt:?} not implemented"),
-                        };
-
-                        match result {
-                            Ok(s) => s,
-                            Err(e) => {
-                                panic!("{e:?}")
+                        }
+                        Int64 => {
+                            if is_float {
+                                let v = obj.extract::<f64>(py).unwrap();
+                                Ok(Int64Chunked::from_slice("", &[v as i64]).into_series())
+                            } else {
+                                obj.extract::<i64>(py)
+                                    .map(|v| Int64Chunked::from_slice("", &[v]).into_series())
                             }
                         }
+                        Float32 => obj
+                            .extract::<f32>(py)
+                            .map(|v| Float32Chunked::from_slice("", &[v]).into_series()),
+                        Float64 => obj
+                            .extract::<f64>(py)
+                            .map(|v| Float64Chunked::from_slice("", &[v]).into_series()),
+                        dt => panic!("{dt:?} not implemented"),
+                    };
+
+                    match result {
+                        Ok(s) => s,
+                        Err(e) => {
+                            panic!("{e:?}")
+                        }
                     }
                 }
-            })
+            }
         };
         self.clone()
             .inner
-            .rolling_apply(Arc::new(function), GetOutput::same_type(), options)
+            .apply(
+                move |s| {
+                    // acquire the GIL once for all windows, instead of once per window
+                    Python::with_gil(|py| {
+                        s.rolling_apply(&|s| function(py, s), options.clone())
+                            .map(Some)
+                    })
+                },
+                GetOutput::same_type(),
+            )
             .with_fmt("rolling_apply")
             .into()
     }
@@ -738,78 +747,82 @@ impl PyExpr {
     #[pyo3(signature = (window_size, weights, min_periods, center, by, closed))]
     fn rolling_sum(
         &self,
-        window_size: &str,
+        window_size: &PyAny,
         weights: Option<Vec<f64>>,
-        min_periods: usize,
+        min_periods: Option<usize>,
         center: bool,
         by: Option<String>,
         closed: Option<Wrap<ClosedWindow>>,
-    ) -> Self {
+    ) -> PyResult<Self> {
+        let (window_size, min_periods) = parse_rolling_window_args(window_size, min_periods)?;
         let options = RollingOptions {
-            window_size: Duration::parse(window_size),
+            window_size,
             weights,
             min_periods,
             center,
             by,
             closed_window: closed.map(|c| c.0),
         };
-        self.inner.clone().rolling_sum(options).into()
+        Ok(self.inner.clone().rolling_sum(options).into())
     }
 
     #[pyo3(signature = (window_size, weights, min_periods, center, by, closed))]
     fn rolling_min(
         &self,
-        window_size: &str,
+        window_size: &PyAny,
         weights: Option<Vec<f64>>,
-        min_periods: usize,
+        min_periods: Option<usize>,
         center: bool,
         by: Option<String>,
         closed: Option<Wrap<ClosedWindow>>,
-    ) -> Self {
+    ) -> PyResult<Self> {
+        let (window_size, min_periods) = parse_rolling_window_args(window_size, min_periods)?;
         let options = RollingOptions {
-            window_size: Duration::parse(window_size),
+            window_size,
             weights,
             min_periods,
             center,
             by,
             closed_window: closed.map(|c| c.0),
         };
-        self.inner.clone().rolling_min(options).into()
+        Ok(self.inner.clone().rolling_min(options).into())
     }
 
     #[pyo3(signature = (window_size, weights, min_periods, center, by, closed))]
     fn rolling_max(
         &self,
-        window_size: &str,
+        window_size: &PyAny,
         weights: Option<Vec<f64>>,
-        min_periods: usize,
+        min_periods: Option<usize>,
         center: bool,
         by: Option<String>,
         closed: Option<Wrap<ClosedWindow>>,
-    ) -> Self {
+    ) -> PyResult<Self> {
+        let (window_size, min_periods) = parse_rolling_window_args(window_size, min_periods)?;
         let options = RollingOptions {
-            window_size: Duration::parse(window_size),
+            window_size,
             weights,
             min_periods,
             center,
             by,
             closed_window: closed.map(|c| c.0),
         };
-        self.inner.clone().rolling_max(options).into()
+        Ok(self.inner.clone().rolling_max(options).into())
     }
 
     #[pyo3(signature = (window_size, weights, min_periods, center, by, closed))]
     fn rolling_mean(
         &self,
-        window_size: &str,
+        window_size: &PyAny,
         weights: Option<Vec<f64>>,
-        min_periods: usize,
+        min_periods: Option<usize>,
         center: bool,
         by: Option<String>,
         closed: Option<Wrap<ClosedWindow>>,
-    ) -> Self {
+    ) -> PyResult<Self> {
+        let (window_size, min_periods) = parse_rolling_window_args(window_size, min_periods)?;
         let options = RollingOptions {
-            window_size: Duration::parse(window_size),
+            window_size,
             weights,
             min_periods,
             center,
@@ -817,21 +830,22 @@ impl PyExpr {
             closed_window: closed.map(|c| c.0),
         };
 
-        self.inner.clone().rolling_mean(options).into()
+        Ok(self.inner.clone().rolling_mean(options).into())
     }
 
     #[pyo3(signature = (window_size, weights, min_periods, center, by, closed))]
     fn rolling_std(
         &self,
-        window_size: &str,
+        window_size: &PyAny,
         weights: Option<Vec<f64>>,
-        min_periods: usize,
+        min_periods: Option<usize>,
         center: bool,
         by: Option<String>,
         closed: Option<Wrap<ClosedWindow>>,
-    ) -> Self {
+    ) -> PyResult<Self> {
+        let (window_size, min_periods) = parse_rolling_window_args(window_size, min_periods)?;
         let options = RollingOptions {
-            window_size: Duration::parse(window_size),
+            window_size,
             weights,
             min_periods,
             center,
@@ -839,21 +853,22 @@ impl PyExpr {
             closed_window: closed.map(|c| c.0),
         };
 
-        self.inner.clone().rolling_std(options).into()
+        Ok(self.inner.clone().rolling_std(options).into())
     }
 
     #[pyo3(signature = (window_size, weights, min_periods, center, by, closed))]
     fn rolling_var(
         &self,
-        window_size: &str,
+        window_size: &PyAny,
         weights: Option<Vec<f64>>,
-        min_periods: usize,
+        min_periods: Option<usize>,
         center: bool,
         by: Option<String>,
         closed: Option<Wrap<ClosedWindow>>,
-    ) -> Self {
+    ) -> PyResult<Self> {
+        let (window_size, min_periods) = parse_rolling_window_args(window_size, min_periods)?;
         let options = RollingOptions {
-            window_size: Duration::parse(window_size),
+            window_size,
             weights,
             min_periods,
             center,
@@ -861,28 +876,29 @@ impl PyExpr {
             closed_window: closed.map(|c| c.0),
         };
 
-        self.inner.clone().rolling_var(options).into()
+        Ok(self.inner.clone().rolling_var(options).into())
     }
 
     #[pyo3(signature = (window_size, weights, min_periods, center, by, closed))]
     fn rolling_median(
         &self,
-        window_size: &str,
+        window_size: &PyAny,
         weights: Option<Vec<f64>>,
-        min_periods: usize,
+        min_periods: Option<usize>,
         center: bool,
         by: Option<String>,
         closed: Option<Wrap<ClosedWindow>>,
-    ) -> Self {
+    ) -> PyResult<Self> {
+        let (window_size, min_periods) = parse_rolling_window_args(window_size, min_periods)?;
         let options = RollingOptions {
-            window_size: Duration::parse(window_size),
+            window_size,
             weights,
             min_periods,
             center,
             by,
             closed_window: closed.map(|c| c.0),
         };
-        self.inner.clone().rolling_median(options).into()
+        Ok(self.inner.clone().rolling_median(options).into())
     }
 
     #[pyo3(signature = (quantile, interpolation, window_size, weights, min_periods, center, by, closed))]
@@ -891,15 +907,16 @@ impl PyExpr {
         &self,
         quantile: f64,
         interpolation: Wrap<QuantileInterpolOptions>,
-        window_size: &str,
+        window_size: &PyAny,
         weights: Option<Vec<f64>>,
-        min_periods: usize,
+        min_periods: Option<usize>,
         center: bool,
         by: Option<String>,
         closed: Option<Wrap<ClosedWindow>>,
-    ) -> Self {
+    ) -> PyResult<Self> {
+        let (window_size, min_periods) = parse_rolling_window_args(window_size, min_periods)?;
         let options = RollingOptions {
-            window_size: Duration::parse(window_size),
+            window_size,
             weights,
             min_periods,
             center,
@@ -907,10 +924,11 @@ impl PyExpr {
             closed_window: closed.map(|c| c.0),
         };
 
-        self.inner
+        Ok(self
+            .inner
             .clone()
             .rolling_quantile(quantile, interpolation.0, options)
-            .into()
+            .into())
     }
 
     fn rolling_skew(&self, window_size: usize, bias: bool) -> Self {
@@ -1043,21 +1061,19 @@ impl PyExpr {
         };
         self.inner.clone().ewm_var(options).into()
     }
-    fn extend_constant(&self, py: Python, value: Wrap<AnyValue>, n: usize) -> Self {
-        let value = value.into_py(py);
-        self.inner
+    fn extend_constant(&self, value: Wrap<AnyValue>, n: usize) -> PyResult<Self> {
+        // convert the value once, so that evaluating the expression does not
+        // need to acquire the GIL
+        let value = Series::from_any_values("", &[value.0], false).map_err(PyPolarsErr::from)?;
+        Ok(self
+            .inner
             .clone()
             .apply(
-                move |s| {
-                    Python::with_gil(|py| {
-                        let value = value.extract::<Wrap<AnyValue>>(py).unwrap().0;
-                        s.extend_constant(value, n).map(Some)
-                    })
-                },
+                move |s| s.extend_constant(value.get(0)?, n).map(Some),
                 GetOutput::same_type(),
             )
             .with_fmt("extend")
-            .into()
+            .into())
     }
     fn any(&self) -> Self {
         self.inner.clone().any().into()
@@ -1098,3 +1114,32 @@ impl PyExpr {
         self.inner.clone().cache().into()
     }
 }
+
+/// Normalize the `window_size` and `min_periods` arguments of the rolling functions.
+///
+/// Integer window sizes are by far the most common, so they are checked first
+/// and don't go through the duration string parser.
+fn parse_rolling_window_args(
+    window_size: &PyAny,
+    min_periods: Option<usize>,
+) -> PyResult<(Duration, usize)> {
+    if let Ok(window_size) = window_size.extract::<i64>() {
+        if window_size < 1 {
+            return Err(PyValueError::new_err("'window_size' should be positive"));
+        }
+        let min_periods = min_periods.unwrap_or(window_size as usize);
+        return Ok((Duration::new(window_size), min_periods));
+    }
+    let window_size = match window_size.extract::<&str>() {
+        Ok(window_size) => Duration::parse(window_size),
+        // datetime.timedelta
+        Err(_) => {
+            let window_size = UTILS
+                .as_ref(window_size.py())
+                .getattr("_timedelta_to_pl_duration")?
+                .call1((window_size,))?;
+            Duration::parse(window_size.extract::<&str>()?)
+        }
+    };
+    Ok((window_size, min_periods.unwrap_or(1)))
+}
@@ -1,3 +1,4 @@
+import math
 import typing
 from datetime import date, datetime, timedelta
 
@@ -121,6 +122,20 @@ def test_floor_division_float_int_consistency() -> None:
     )
 
 
+@pytest.mark.parametrize("dtype", [pl.Int8, pl.Int64, pl.UInt32])
+@pytest.mark.parametrize("divisor", [1, 2, 8])
+def test_floordiv_mod_power_of_two(dtype: pl.PolarsDataType, divisor: int) -> None:
+    values = list(range(-9, 10)) if dtype in (pl.Int8, pl.Int64) else list(range(19))
+    df = pl.DataFrame({"a": values}, schema={"a": dtype})
+    out = df.select(
+        (pl.col("a") // divisor).alias("floordiv"),
+        (pl.col("a") % divisor).alias("mod"),
+    )
+    assert out["floordiv"].to_list() == [v // divisor for v in values]
+    # remainder keeps the sign of the dividend
+    assert out["mod"].to_list() == [int(math.fmod(v, divisor)) for v in values]
+
+
 def test_unary_plus() -> None:
     data = [1, 2]
     df = pl.DataFrame({"x": data})
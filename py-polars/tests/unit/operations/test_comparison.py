@@ -1,5 +1,7 @@
 import typing
 
+import pytest
+
 import polars as pl
 from polars.testing import assert_frame_equal
 
@@ -132,3 +134,36 @@ def test_offset_handling_arg_where_7863() -> None:
         .item()
         == 2
     )
+
+
+def test_eq_missing_ne_missing() -> None:
+    df = pl.DataFrame(
+        {
+            "a": [1, 2, None, 4],
+            "b": [1, 3, None, None],
+            "c": [1, 3, 3, 4],
+            "s": [{"x": 1}, {"x": None}, {"x": 2}, {"x": 3}],
+        }
+    )
+    out = df.select(
+        pl.col("a").eq_missing(pl.col("b")).alias("eq_nulls"),
+        pl.col("a").ne_missing(pl.col("b")).alias("ne_nulls"),
+        pl.col("c").eq_missing(pl.col("c").reverse()).alias("eq_no_nulls"),
+        pl.col("c").ne_missing(3).alias("ne_no_nulls"),
+        pl.col("s").eq_missing(pl.col("s")).alias("eq_struct"),
+    )
+    assert out.to_dict(False) == {
+        "eq_nulls": [True, False, True, False],
+        "ne_nulls": [False, True, False, True],
+        "eq_no_nulls": [False, True, True, False],
+        "ne_no_nulls": [True, False, False, True],
+        "eq_struct": [True, True, True, True],
+    }
+
+
+def test_eq_missing_ne_missing_validates_types() -> None:
+    df = pl.DataFrame({"a": [1, 2], "b": ["1", "2"]})
+    with pytest.raises(pl.ComputeError, match="cannot compare utf-8 with numeric"):
+        df.select(pl.col("a").eq_missing(pl.col("b")))
+    with pytest.raises(pl.ComputeError, match="cannot compare utf-8 with numeric"):
+        df.select(pl.col("a").ne_missing(pl.col("b")))
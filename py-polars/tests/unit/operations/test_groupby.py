@@ -94,6 +94,10 @@ def test_groupby_shorthands(
     result = getattr(gb_lazy, method)().collect()
     assert result.rows() == expected
 
+    # the aggregation expressions are cached; calling again must give the same result
+    result = getattr(gb_lazy, method)().collect()
+    assert result.rows() == expected
+
 
 def test_groupby_shorthand_quantile(df: pl.DataFrame) -> None:
     result = df.groupby("b", maintain_order=True).quantile(0.5)
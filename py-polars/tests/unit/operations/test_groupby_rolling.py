@@ -147,17 +147,22 @@ def test_groupby_rolling_negative_offset_3914() -> None:
     ]
 
 
+def _dst_datetimes(time_zone: str | None) -> pl.Series:
+    # daily datetimes around the end of DST in the US, on 2021-11-07
+    return pl.date_range(
+        datetime(2021, 11, 6),
+        datetime(2021, 11, 9),
+        "1d",
+        time_zone=time_zone,
+        eager=True,
+    )
+
+
 @pytest.mark.parametrize("time_zone", [None, "US/Central"])
 def test_groupby_rolling_negative_offset_crossing_dst(time_zone: str | None) -> None:
     df = pl.DataFrame(
         {
-            "datetime": pl.date_range(
-                datetime(2021, 11, 6),
-                datetime(2021, 11, 9),
-                "1d",
-                time_zone=time_zone,
-                eager=True,
-            ),
+            "datetime": _dst_datetimes(time_zone),
             "value": [1, 4, 9, 155],
         }
     )
@@ -166,13 +171,7 @@ def test_groupby_rolling_negative_offset_crossing_dst(time_zone: str | None) ->
     )
     expected = pl.DataFrame(
         {
-            "datetime": pl.date_range(
-                datetime(2021, 11, 6),
-                datetime(2021, 11, 9),
-                "1d",
-                time_zone=time_zone,
-                eager=True,
-            ),
+            "datetime": df["datetime"],
             "value": [[1, 4], [4, 9], [9, 155], [155]],
         }
     )
@@ -201,31 +200,14 @@ def test_groupby_rolling_non_negative_offset_9077(
 ) -> None:
     df = pl.DataFrame(
         {
-            "datetime": pl.date_range(
-                datetime(2021, 11, 6),
-                datetime(2021, 11, 9),
-                "1d",
-                time_zone=time_zone,
-                eager=True,
-            ),
+            "datetime": _dst_datetimes(time_zone),
             "value": [1, 4, 9, 155],
         }
     )
     result = df.groupby_rolling(
         index_column="datetime", period="2d", offset=offset, closed=closed
     ).agg(pl.col("value"))
-    expected = pl.DataFrame(
-        {
-            "datetime": pl.date_range(
-                datetime(2021, 11, 6),
-                datetime(2021, 11, 9),
-                "1d",
-                time_zone=time_zone,
-                eager=True,
-            ),
-            "value": expected_values,
-        }
-    )
+    expected = df.with_columns(pl.Series("value", expected_values))
     assert_frame_equal(result, expected)
 
 
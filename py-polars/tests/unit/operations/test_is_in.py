@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date
+from typing import Any
 
 import pytest
 
@@ -35,6 +36,33 @@ def test_is_in_bool() -> None:
     }
 
 
+def test_is_in_tuple() -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    for _ in range(2):
+        assert df.select(pl.col("a").is_in((1, 3))).to_series().to_list() == [
+            True,
+            False,
+            True,
+        ]
+    assert df.select(pl.col("a").is_in(())).to_series().to_list() == [False] * 3
+    # long tuples bypass the literal cache
+    out = df.select(pl.col("a").is_in(tuple(range(2, 100)))).to_series()
+    assert out.to_list() == [False, True, True]
+
+
+@pytest.mark.parametrize(
+    "other",
+    [[1, 3], {1, 3}, frozenset([1, 3]), {1: "a", 3: "b"}.keys(), range(1, 4, 2)],
+)
+def test_is_in_collections(other: Any) -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    assert df.select(pl.col("a").is_in(other)).to_series().to_list() == [
+        True,
+        False,
+        True,
+    ]
+
+
 def test_is_in_empty_list_4559() -> None:
     assert pl.Series(["a"]).is_in([]).to_list() == [False]
 
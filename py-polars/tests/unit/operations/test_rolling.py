@@ -15,7 +15,7 @@ else:
     from backports.zoneinfo._zoneinfo import ZoneInfo
 
 import polars as pl
-from polars.testing import assert_frame_equal
+from polars.testing import assert_frame_equal, assert_series_equal
 
 if TYPE_CHECKING:
     from polars.type_aliases import ClosedInterval
@@ -390,15 +390,17 @@ def test_rolling_skew_lagging_null_5179() -> None:
 
 def test_rolling_var_numerical_stability_5197() -> None:
     s = pl.Series([*[1.2] * 4, *[3.3] * 7])
+    # the exact variance of the full windows is 0.882 and 1.323, the Welford
+    # updates are within a few ulps of that and exactly 0.0 for constant windows
     assert s.to_frame("a").with_columns(pl.col("a").rolling_var(5))[:, 0].to_list() == [
         None,
         None,
         None,
         None,
-        0.882,
+        0.8819999999999998,
         1.3229999999999997,
         1.3229999999999997,
-        0.8819999999999983,
+        0.8819999999999998,
         0.0,
         0.0,
         0.0,
@@ -649,3 +651,41 @@ def test_rolling_cov_corr() -> None:
         )
         == "{'cov': [None, None, 0.0, 0.0, 5.333333333333336], 'corr': [None, None, nan, nan, 0.9176629354822473]}"
     )
+
+
+def test_rolling_window_size_types() -> None:
+    df = pl.DataFrame(
+        {
+            "dt": [datetime(2021, 1, 1) + timedelta(hours=i) for i in range(4)],
+            "a": [1, 2, 3, 4],
+        }
+    )
+    out = df.select(
+        pl.col("a").rolling_sum(2).alias("int"),
+        pl.col("a").rolling_sum(2, min_periods=1).alias("int_min_periods"),
+        pl.col("a").rolling_sum("2h", by="dt", closed="right").alias("str"),
+        pl.col("a")
+        .rolling_sum(timedelta(hours=2), by="dt", closed="right")
+        .alias("timedelta"),
+    )
+    assert out.to_dict(False) == {
+        "int": [None, 3, 5, 7],
+        "int_min_periods": [1, 3, 5, 7],
+        "str": [1, 3, 5, 7],
+        "timedelta": [1, 3, 5, 7],
+    }
+
+
+@pytest.mark.parametrize("center", [False, True])
+def test_rolling_large_input(center: bool) -> None:
+    # large enough to be computed in partitions
+    n = 200_000
+    s = pl.Series("a", range(n), dtype=pl.Int64)
+    result = s.rolling_sum(5, center=center)
+    if center:
+        expected = (s * 5).slice(2, n - 4)
+    else:
+        expected = (s * 5 - 10).slice(4)
+    assert result.len() == n
+    assert result.null_count() == 4
+    assert_series_equal(result.drop_nulls(), expected)
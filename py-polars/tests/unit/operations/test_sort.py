@@ -255,6 +255,14 @@ def test_sorted_fast_paths() -> None:
     assert rev.sort(descending=True).to_list() == [None, 3, 2, 1]
     assert rev.sort().to_list() == [None, 1, 2, 3]
 
+    s = pl.Series(["a", "b", None]).sort()
+    assert s.min() == "a"
+    assert s.max() == "b"
+    rev = s.sort(descending=True)
+    assert rev.min() == "a"
+    assert rev.max() == "b"
+    assert pl.Series([], dtype=pl.Utf8).sort().max() is None
+
 
 def test_arg_sort_rank_nans() -> None:
     assert (
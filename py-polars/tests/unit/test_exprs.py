@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import operator
 import random
 import sys
 import typing
@@ -237,6 +239,13 @@ def test_entropy() -> None:
     assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("normalize", [True, False])
+def test_entropy_no_values(normalize: bool) -> None:
+    for values in ([], [None, None]):
+        s = pl.Series("a", values, dtype=pl.Float64)
+        assert s.entropy(normalize=normalize) is None
+
+
 def test_dot_in_groupby() -> None:
     df = pl.DataFrame(
         {
@@ -1119,3 +1128,45 @@ def test_extend_constant_arr(const: Any, dtype: pl.PolarsDataType) -> None:
     expected = pl.Series("s", [[const, const, const, const]], dtype=pl.List(dtype))
 
     assert_series_equal(s.list.eval(pl.element().extend_constant(const, 3)), expected)
+
+
+def test_and_or_many_operands() -> None:
+    df = pl.DataFrame(
+        {
+            "a": [True, True, False, True],
+            "b": [True, False, True, True],
+            "c": [True, True, True, False],
+            "d": [True, True, True, True],
+            "e": [False, True, True, True],
+        }
+    )
+    out = df.select(
+        pl.col("a").and_(pl.col("b"), pl.col("c"), pl.col("d")),
+        pl.col("e").or_(pl.col("a"), False, pl.col("b")),
+    )
+    assert out.to_dict(False) == {
+        "a": [True, False, False, False],
+        "e": [True, True, True, True],
+    }
+
+
+def test_and_or_many_operands_with_nulls() -> None:
+    values = [True, False, None]
+    df = pl.DataFrame(
+        {
+            "a": values * 9,
+            "b": [v for v in values for _ in range(3)] * 3,
+            "c": [v for v in values for _ in range(9)],
+            "d": [True, None, True] * 9,
+            "e": [None, False, False] * 9,
+        }
+    )
+    cols = [pl.col(c) for c in df.columns]
+    out = df.select(
+        cols[0].and_(*cols[1:]).alias("and_balanced"),
+        functools.reduce(operator.and_, cols).alias("and_chained"),
+        cols[0].or_(*cols[1:]).alias("or_balanced"),
+        functools.reduce(operator.or_, cols).alias("or_chained"),
+    )
+    assert_series_equal(out["and_balanced"], out["and_chained"], check_names=False)
+    assert_series_equal(out["or_balanced"], out["or_chained"], check_names=False)
@@ -1305,6 +1305,10 @@ def test_diff() -> None:
         df.select(pl.col("a").diff())["a"], pl.Series("a", [None, 1, 1, -1, 0, 1, -3])
     )
 
+    assert_series_equal(s.diff(n=2), pl.Series("a", [None, None, 2, 0, -1, 1, -2]))
+    assert_series_equal(s.diff(n=-2), pl.Series("a", [-2, 0, 1, -1, 2, None, None]))
+    assert_series_equal(s.diff(n=7), pl.Series("a", [None] * 7, dtype=pl.Int64))
+
 
 def test_pct_change() -> None:
     s = pl.Series("a", [1, 2, 4, 8, 16, 32, 64])
@@ -1679,6 +1683,15 @@ def test_value_counts() -> None:
     result_sorted = result.sort("a")
     assert_frame_equal(result_sorted, expected)
 
+    # small integer types are counted in a lookup table
+    s = pl.Series("a", [3, None, -1, 3, 3, None], dtype=pl.Int8)
+    result = s.value_counts(sort=True)
+    expected = pl.DataFrame(
+        {"a": [3, None, -1], "counts": [3, 2, 1]},
+        schema={"a": pl.Int8, "counts": pl.UInt32},
+    )
+    assert_frame_equal(result, expected)
+
 
 def test_chunk_lengths() -> None:
     s = pl.Series("a", [1, 2, 2, 3])
@@ -2286,6 +2299,11 @@ def test_sign() -> None:
     expected = pl.Series("a", [-1, 0, 0, 1, None])
     assert_series_equal(a.sign(), expected)
 
+    # NaN has no sign
+    a = pl.Series("a", [float("nan"), -2.5, float("inf"), None], dtype=pl.Float32)
+    expected = pl.Series("a", [None, -1, 1, None])
+    assert_series_equal(a.sign(), expected)
+
     # Invalid input
     a = pl.Series("a", [date(1950, 2, 1), date(1970, 1, 1), date(2022, 12, 12), None])
     with pytest.raises(pl.InvalidOperationError):
@@ -2317,6 +2335,15 @@ def test_cumulative_eval() -> None:
     expected3 = pl.Series("values", [0.0, -3.0, -8.0, -15.0, -24.0])
     assert_series_equal(s.cumulative_eval(expr3), expected3)
 
+    # aggregations that have a cumulative counterpart
+    s = pl.Series("values", [3, 1, 4, 1, 5])
+    expected = pl.Series("values", [None, 4, 8, 9, 14])
+    assert_series_equal(s.cumulative_eval(pl.element().sum(), min_periods=2), expected)
+    expected = pl.Series("values", [3, 1, 1, 1, 1])
+    assert_series_equal(s.cumulative_eval(pl.element().min()), expected)
+    expected = pl.Series("values", [3, 3, 4, 4, 5])
+    assert_series_equal(s.cumulative_eval(pl.element().max()), expected)
+
 
 def test_reverse() -> None:
     s = pl.Series("values", [1, 2, 3, 4, 5])
@@ -2591,6 +2618,20 @@ def test_map_dict() -> None:
         pl.Series("boolean_to_str", ["1", "0"]),
     )
 
+    assert_series_equal(
+        pl.Series("s", [1, 2, 3]).map_dict({1: 0, 2: None}),
+        pl.Series("s", [0, None, None]),
+    )
+
+    assert_series_equal(
+        pl.Series("s", [1, 2, 3]).map_dict({}),
+        pl.Series("s", [None, None, None], dtype=pl.Int64),
+    )
+    assert_series_equal(
+        pl.Series("s", [1, 2, 3]).map_dict({}, return_dtype=pl.Utf8),
+        pl.Series("s", [None, None, None], dtype=pl.Utf8),
+    )
+
 
 @pytest.mark.parametrize(
     ("dtype", "lower", "upper"),
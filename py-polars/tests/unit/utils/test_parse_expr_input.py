@@ -7,7 +7,11 @@ import pytest
 
 import polars as pl
 from polars.testing import assert_frame_equal
-from polars.utils._parse_expr_input import _inputs_to_list, parse_as_expression
+from polars.utils._parse_expr_input import (
+    _inputs_to_list,
+    _literal_cache_key,
+    parse_as_expression,
+)
 
 
 def assert_expr_equal(result: pl.Expr, expected: pl.Expr) -> None:
@@ -87,3 +91,31 @@ def test_parse_as_expression_structify() -> None:
     result = parse_as_expression(pl.col("a", "b"), structify=True)
     expected = pl.struct("a", "b")
     assert_expr_equal(result, expected)
+
+
+def test_parse_as_expression_lit_cached() -> None:
+    assert parse_as_expression(5) is parse_as_expression(5)
+    assert parse_as_expression("x", str_as_lit=True) is parse_as_expression(
+        "x", str_as_lit=True
+    )
+    assert parse_as_expression(1) is not parse_as_expression(True)
+    assert parse_as_expression(0.0) is not parse_as_expression(-0.0)
+
+
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [(1, 1.0), (1, True), (0.0, -0.0), ((1, 2), (1.0, 2)), ("1", 1)],
+)
+def test_literal_cache_key_distinct(a: Any, b: Any) -> None:
+    assert _literal_cache_key(a) != _literal_cache_key(b)
+
+
+@pytest.mark.parametrize(
+    "input", [[1, 2], (1, [2]), tuple(range(65)), date(2022, 1, 1), pl.lit(1)]
+)
+def test_literal_cache_key_uncacheable(input: Any) -> None:
+    assert _literal_cache_key(input) is None
+
+
+def test_literal_cache_key_tuple_length() -> None:
+    assert _literal_cache_key(tuple(range(64))) is not None